@@ -121,22 +121,57 @@ static String removeEllipsis (const String& path)
 
 static String normaliseSeparators (const String& path)
 {
-    auto normalisedPath = path;
+    const auto separator = File::getSeparatorChar();
+    auto t = path.getCharPointer();
 
-    String separator (File::getSeparatorString());
-    String doubleSeparator (separator + separator);
-
-    auto uncPath = normalisedPath.startsWith (doubleSeparator)
-                  && ! normalisedPath.fromFirstOccurrenceOf (doubleSeparator, false, false).startsWith (separator);
+    // A path starting with exactly two separators is a UNC path, and keeps that prefix
+    const bool uncPath = t[0] == separator && t[1] == separator && t[2] != separator;
 
     if (uncPath)
-        normalisedPath = normalisedPath.fromFirstOccurrenceOf (doubleSeparator, false, false);
+        t += 2;
+
+    // Collapse each run of separators into a single one in one pass, only building
+    // a new string if a run is actually found (which is rarely the case).
+    String normalisedPath;
+    auto segmentStart = t;
+    bool anythingChanged = false, lastWasSeparator = false;
 
-    while (normalisedPath.contains (doubleSeparator))
-         normalisedPath = normalisedPath.replace (doubleSeparator, separator);
+    for (;;)
+    {
+        const auto current = t;
+        const auto c = t.getAndAdvance();
 
-    return uncPath ? doubleSeparator + normalisedPath
-                   : normalisedPath;
+        if (c == 0)
+        {
+            t = current;
+            break;
+        }
+
+        const bool isSeparator = (c == separator);
+
+        if (isSeparator && lastWasSeparator)
+        {
+            if (! anythingChanged)
+            {
+                anythingChanged = true;
+                normalisedPath.preallocateBytes (path.getCharPointer().sizeInBytes());
+
+                if (uncPath)
+                    normalisedPath << separator << separator;
+            }
+
+            normalisedPath.appendCharPointer (segmentStart, current);
+            segmentStart = t;
+        }
+
+        lastWasSeparator = isSeparator;
+    }
+
+    if (! anythingChanged)
+        return path;
+
+    normalisedPath.appendCharPointer (segmentStart, t);
+    return normalisedPath;
 }
 
 bool File::isRoot() const
@@ -486,7 +521,13 @@ File File::getChildFile (StringRef relativePath) const
         }
     }
 
-    path = addTrailingSeparator (path);
+    // reserve enough space up-front so that the separator and child name are
+    // appended without reallocating
+    path.preallocateBytes (path.getCharPointer().sizeInBytes() + r.sizeInBytes());
+
+    if (! path.endsWithChar (separatorChar))
+        path << separatorChar;
+
     path.appendCharPointer (r);
     return File (path);
 }
@@ -575,6 +616,20 @@ String File::loadFileAsString() const
     if (! existsAsFile())
         return {};
 
+   #if ! JUCE_WASM
+    // Large files are decoded straight out of a read-only mapping, which avoids
+    // reading everything into an intermediate buffer before building the string.
+    const auto fileSize = getSize();
+
+    if (fileSize >= 64 * 1024 && fileSize <= (int64) std::numeric_limits<int>::max())
+    {
+        MemoryMappedFile mappedFile (*this, MemoryMappedFile::readOnly);
+
+        if (mappedFile.getData() != nullptr && (int64) mappedFile.getSize() == fileSize)
+            return String::createStringFromData (mappedFile.getData(), (int) mappedFile.getSize());
+    }
+   #endif
+
     FileInputStream in (*this);
     return in.openedOk() ? in.readEntireStreamAsString()
                          : String();
@@ -795,9 +850,11 @@ bool File::replaceWithData (const void* const dataToWrite,
     if (numberOfBytes == 0)
         return deleteFile();
 
+    // If the temporary file can't be written in full, the target is left untouched
+    // rather than being replaced with a truncated copy.
     TemporaryFile tempFile (*this, TemporaryFile::useHiddenFile);
-    tempFile.getFile().appendData (dataToWrite, numberOfBytes);
-    return tempFile.overwriteTargetFileWithTemporary();
+    return tempFile.getFile().appendData (dataToWrite, numberOfBytes)
+            && tempFile.overwriteTargetFileWithTemporary();
 }
 
 bool File::appendText (const String& text, bool asUnicode, bool writeHeaderBytes, const char* lineFeed) const
@@ -813,8 +870,8 @@ bool File::appendText (const String& text, bool asUnicode, bool writeHeaderBytes
 bool File::replaceWithText (const String& textToWrite, bool asUnicode, bool writeHeaderBytes, const char* lineFeed) const
 {
     TemporaryFile tempFile (*this, TemporaryFile::useHiddenFile);
-    tempFile.getFile().appendText (textToWrite, asUnicode, writeHeaderBytes, lineFeed);
-    return tempFile.overwriteTargetFileWithTemporary();
+    return tempFile.getFile().appendText (textToWrite, asUnicode, writeHeaderBytes, lineFeed)
+            && tempFile.overwriteTargetFileWithTemporary();
 }
 
 bool File::hasIdenticalContentTo (const File& other) const
@@ -40,11 +40,93 @@
 namespace juce
 {
 
+//==============================================================================
+namespace
+{
+
+// Keeps a few write buffers of the common sizes around after their stream has been
+// closed, so that code which repeatedly opens and closes files doesn't have to go
+// back to the allocator for a new buffer every time.
+class FileOutputStreamBufferPool
+{
+public:
+    static FileOutputStreamBufferPool& getInstance()
+    {
+        // Deliberately never deleted: a FileOutputStream owned by some other static
+        // object can still be closed during static destruction, after a function-local
+        // pool would already have been torn down.
+        static auto* pool = new FileOutputStreamBufferPool();
+        return *pool;
+    }
+
+    static size_t getAllocationSize (size_t bufferSize) noexcept
+    {
+        // small (or unbuffered) streams just get the little block they asked for, as
+        // rounding those up to the smallest bucket would waste more than it saves
+        if (bufferSize < bucketSizes[0])
+            return jmax (bufferSize, (size_t) 16);
+
+        for (auto bucketSize : bucketSizes)
+            if (bufferSize <= bucketSize)
+                return bucketSize;
+
+        return bufferSize;
+    }
+
+    HeapBlock<char> acquire (size_t allocationSize)
+    {
+        if (auto* bucket = getBucket (allocationSize))
+        {
+            const SpinLock::ScopedLockType sl (lock);
+
+            if (bucket->numFree > 0)
+                return std::move (bucket->freeBlocks[--bucket->numFree]);
+        }
+
+        return HeapBlock<char> (allocationSize);
+    }
+
+    void release (HeapBlock<char>& block, size_t allocationSize) noexcept
+    {
+        if (auto* bucket = getBucket (allocationSize))
+        {
+            const SpinLock::ScopedLockType sl (lock);
+
+            if (bucket->numFree < maxFreeBlocksPerBucket)
+                bucket->freeBlocks[bucket->numFree++] = std::move (block);
+        }
+    }
+
+private:
+    static constexpr size_t bucketSizes[] = { 4096, 16384, 32768, 262144 };
+    static constexpr int maxFreeBlocksPerBucket = 4;
+
+    struct Bucket
+    {
+        HeapBlock<char> freeBlocks[maxFreeBlocksPerBucket];
+        int numFree = 0;
+    };
+
+    Bucket* getBucket (size_t allocationSize) noexcept
+    {
+        for (int i = 0; i < numElementsInArray (bucketSizes); ++i)
+            if (bucketSizes[i] == allocationSize)
+                return buckets + i;
+
+        return nullptr;
+    }
+
+    SpinLock lock;
+    Bucket buckets[numElementsInArray (bucketSizes)];
+};
+
+} // namespace
+
 //==============================================================================
 FileOutputStream::FileOutputStream (const File& f, const size_t bufferSizeToUse)
     : file (f),
       bufferSize (bufferSizeToUse),
-      buffer (jmax (bufferSizeToUse, (size_t) 16))
+      buffer (FileOutputStreamBufferPool::getInstance().acquire (FileOutputStreamBufferPool::getAllocationSize (bufferSizeToUse)))
 {
     openHandle();
 }
@@ -53,6 +135,8 @@ FileOutputStream::~FileOutputStream()
 {
     flushBuffer();
     closeHandle();
+
+    FileOutputStreamBufferPool::getInstance().release (buffer, FileOutputStreamBufferPool::getAllocationSize (bufferSize));
 }
 
 int64 FileOutputStream::getPosition()
@@ -40,23 +40,37 @@
 namespace juce
 {
 
-static void parseWildcard (const String& pattern, StringArray& result)
+static void parseWildcard (const String& pattern, StringArray& suffixes, StringArray& wildcards)
 {
+    StringArray result;
     result.addTokens (pattern.toLowerCase(), ";,", "\"'");
     result.trim();
     result.removeEmptyStrings();
 
-    // special case for *.*, because people use it to mean "any file", but it
-    // would actually ignore files with no extension.
     for (auto& r : result)
+    {
+        // special case for *.*, because people use it to mean "any file", but it
+        // would actually ignore files with no extension.
         if (r == "*.*")
             r = "*";
+
+        // Patterns like "*.wav" (and "*" itself) only need a tail compare, so keep
+        // them apart from the ones that need the full wildcard matcher.
+        if (r.startsWithChar ('*') && ! r.substring (1).containsAnyOf ("*?"))
+            suffixes.add (r.substring (1));
+        else
+            wildcards.add (r);
+    }
 }
 
-static bool matchWildcard (const File& file, const StringArray& wildcards)
+static bool matchWildcard (const File& file, const StringArray& suffixes, const StringArray& wildcards)
 {
     auto filename = file.getFileName();
 
+    for (auto& s : suffixes)
+        if (filename.endsWithIgnoreCase (s))
+            return true;
+
     for (auto& w : wildcards)
         if (filename.matchesWildcard (w, true))
             return true;
@@ -70,8 +84,8 @@ WildcardFileFilter::WildcardFileFilter (const String& fileWildcardPatterns,
     : FileFilter (desc.isEmpty() ? fileWildcardPatterns
                                  : (desc + " (" + fileWildcardPatterns + ")"))
 {
-    parseWildcard (fileWildcardPatterns, fileWildcards);
-    parseWildcard (directoryWildcardPatterns, directoryWildcards);
+    parseWildcard (fileWildcardPatterns, fileSuffixes, fileWildcards);
+    parseWildcard (directoryWildcardPatterns, directorySuffixes, directoryWildcards);
 }
 
 WildcardFileFilter::~WildcardFileFilter()
@@ -80,12 +94,12 @@ WildcardFileFilter::~WildcardFileFilter()
 
 bool WildcardFileFilter::isFileSuitable (const File& file) const
 {
-    return matchWildcard (file, fileWildcards);
+    return matchWildcard (file, fileSuffixes, fileWildcards);
 }
 
 bool WildcardFileFilter::isDirectorySuitable (const File& file) const
 {
-    return matchWildcard (file, directoryWildcards);
+    return matchWildcard (file, directorySuffixes, directoryWildcards);
 }
 
 } // namespace juce
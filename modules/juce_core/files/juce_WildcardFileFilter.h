@@ -85,6 +85,7 @@ public:
 
 private:
     //==============================================================================
+    StringArray fileSuffixes, directorySuffixes;
     StringArray fileWildcards, directoryWildcards;
 
     JUCE_LEAK_DETECTOR (WildcardFileFilter)
@@ -328,50 +328,113 @@ struct JSONFormatter
         out << "\\u" << String::toHexString ((int) value).paddedLeft ('0', 4);
     }
 
-    static void writeString (OutputStream& out, String::CharPointerType t)
+    static bool writeEscapedCharacter (OutputStream& out, juce_wchar c)
     {
-        for (;;)
+        switch (c)
         {
-            auto c = t.getAndAdvance();
+            case 0:  return false;
 
-            switch (c)
-            {
-                case 0:  return;
-
-                case '\"':  out << "\\\""; break;
-                case '\\':  out << "\\\\"; break;
-                case '\a':  out << "\\a";  break;
-                case '\b':  out << "\\b";  break;
-                case '\f':  out << "\\f";  break;
-                case '\t':  out << "\\t";  break;
-                case '\r':  out << "\\r";  break;
-                case '\n':  out << "\\n";  break;
-
-                default:
-                    if (c >= 32 && c < 127)
+            case '\"':  out << "\\\""; break;
+            case '\\':  out << "\\\\"; break;
+            case '\a':  out << "\\a";  break;
+            case '\b':  out << "\\b";  break;
+            case '\f':  out << "\\f";  break;
+            case '\t':  out << "\\t";  break;
+            case '\r':  out << "\\r";  break;
+            case '\n':  out << "\\n";  break;
+
+            default:
+                if (c >= 32 && c < 127)
+                {
+                    out << (char) c;
+                }
+                else
+                {
+                    if (CharPointer_UTF16::getBytesRequiredFor (c) > 2)
                     {
-                        out << (char) c;
+                        CharPointer_UTF16::CharType chars[2];
+                        CharPointer_UTF16 utf16 (chars);
+                        utf16.write (c);
+
+                        for (int i = 0; i < 2; ++i)
+                            writeEscapedChar (out, (unsigned short) chars[i]);
                     }
                     else
                     {
-                        if (CharPointer_UTF16::getBytesRequiredFor (c) > 2)
-                        {
-                            CharPointer_UTF16::CharType chars[2];
-                            CharPointer_UTF16 utf16 (chars);
-                            utf16.write (c);
-
-                            for (int i = 0; i < 2; ++i)
-                                writeEscapedChar (out, (unsigned short) chars[i]);
-                        }
-                        else
-                        {
-                            writeEscapedChar (out, (unsigned short) c);
-                        }
+                        writeEscapedChar (out, (unsigned short) c);
                     }
+                }
 
-                    break;
-            }
+                break;
+        }
+
+        return true;
+    }
+
+   #if JUCE_STRING_UTF_TYPE == 8
+    static constexpr bool isCopiedVerbatim (char c) noexcept
+    {
+        return c >= 32 && c < 127 && c != '\"' && c != '\\';
+    }
+
+    // Classifies 8 bytes at once: returns true if any of them is a quote, a backslash,
+    // a control character, DEL or part of a multi-byte sequence.
+    static constexpr bool wordNeedsEscaping (uint64 word) noexcept
+    {
+        constexpr uint64 ones = 0x0101010101010101ull;
+        constexpr uint64 highBits = 0x8080808080808080ull;
+
+        auto hasZeroByte = [] (uint64 w) { return (w - ones) & ~w & highBits; };
+
+        return ((word & highBits)
+                | ((word - ones * 0x20) & ~word & highBits)
+                | hasZeroByte (word ^ (ones * '"'))
+                | hasZeroByte (word ^ (ones * '\\'))
+                | hasZeroByte (word ^ (ones * 0x7f))) != 0;
+    }
+
+    static const char* findEndOfVerbatimRun (const char* p, const char* end) noexcept
+    {
+        for (; end - p >= 8; p += 8)
+        {
+            uint64 word;
+            std::memcpy (&word, p, sizeof (word));
+
+            if (wordNeedsEscaping (word))
+                break;
+        }
+
+        while (p < end && isCopiedVerbatim (*p))
+            ++p;
+
+        return p;
+    }
+   #endif
+
+    static void writeString (OutputStream& out, String::CharPointerType t)
+    {
+       #if JUCE_STRING_UTF_TYPE == 8
+        auto* start = t.getAddress();
+        auto* end = start + t.sizeInBytes() - 1;
+
+        for (;;)
+        {
+            auto* runEnd = findEndOfVerbatimRun (start, end);
+
+            if (runEnd != start)
+                out.write (start, (size_t) (runEnd - start));
+
+            if (runEnd == end)
+                return;
+
+            String::CharPointerType next (runEnd);
+            writeEscapedCharacter (out, next.getAndAdvance());
+            start = next.getAddress();
         }
+       #else
+        while (writeEscapedCharacter (out, t.getAndAdvance()))
+        {}
+       #endif
     }
 
     static void writeSpaces (OutputStream& out, int numSpaces)
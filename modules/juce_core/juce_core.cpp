@@ -58,6 +58,11 @@
 #include <locale>
 #include <thread>
 
+#if JUCE_INTEL && (defined (__SSE2__) || defined (_M_X64) || (defined (_M_IX86_FP) && _M_IX86_FP >= 2))
+ #define JUCE_CORE_HAS_SSE2 1
+ #include <emmintrin.h>
+#endif
+
 #if ! (JUCE_ANDROID || JUCE_BSD)
  #include <sys/timeb.h>
  #include <cwctype>
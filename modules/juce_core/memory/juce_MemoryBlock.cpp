@@ -47,6 +47,7 @@ MemoryBlock::MemoryBlock (size_t initialSize, bool initialiseToZero)
     if (initialSize > 0)
     {
         size = initialSize;
+        allocatedSize = initialSize;
         data.allocate (initialSize, initialiseToZero);
     }
     else
@@ -56,18 +57,20 @@ MemoryBlock::MemoryBlock (size_t initialSize, bool initialiseToZero)
 }
 
 MemoryBlock::MemoryBlock (const MemoryBlock& other)
-    : size (other.size)
+    : size (other.size),
+      allocatedSize (other.size)
 {
     if (size > 0)
     {
         jassert (other.data != nullptr);
         data.malloc (size);
-        memcpy (data, other.data, size);
+        memcpy (data, other.getData(), size);
     }
 }
 
 MemoryBlock::MemoryBlock (const void* const dataToInitialiseFrom, const size_t sizeInBytes)
-    : size (sizeInBytes)
+    : size (sizeInBytes),
+      allocatedSize (sizeInBytes)
 {
     jassert (((ssize_t) sizeInBytes) >= 0);
 
@@ -89,31 +92,35 @@ MemoryBlock::~MemoryBlock() noexcept
 MemoryBlock& MemoryBlock::operator= (const MemoryBlock& other)
 {
     if (this != &other)
-    {
-        setSize (other.size, false);
-        memcpy (data, other.data, size);
-    }
+        replaceAll (other.getData(), other.size);
 
     return *this;
 }
 
 MemoryBlock::MemoryBlock (MemoryBlock&& other) noexcept
     : data (std::move (other.data)),
-      size (other.size)
+      size (other.size),
+      allocatedSize (other.allocatedSize),
+      headOffset (other.headOffset)
 {
+    other.size = 0;
+    other.allocatedSize = 0;
+    other.headOffset = 0;
 }
 
 MemoryBlock& MemoryBlock::operator= (MemoryBlock&& other) noexcept
 {
     data = std::move (other.data);
-    size = other.size;
+    std::swap (size, other.size);
+    std::swap (allocatedSize, other.allocatedSize);
+    std::swap (headOffset, other.headOffset);
     return *this;
 }
 
 //==============================================================================
 bool MemoryBlock::operator== (const MemoryBlock& other) const noexcept
 {
-    return matches (other.data, other.size);
+    return matches (other.getData(), other.size);
 }
 
 bool MemoryBlock::operator!= (const MemoryBlock& other) const noexcept
@@ -124,7 +131,20 @@ bool MemoryBlock::operator!= (const MemoryBlock& other) const noexcept
 bool MemoryBlock::matches (const void* dataToCompare, size_t dataSize) const noexcept
 {
     return size == dataSize
-            && memcmp (data, dataToCompare, size) == 0;
+            && memcmp (getData(), dataToCompare, size) == 0;
+}
+
+bool MemoryBlock::containsOnly (uint8 value) const noexcept
+{
+    if (size == 0)
+        return true;
+
+    // If the first byte matches and every byte equals the one after it, they all match,
+    // and this lets memcmp do the scanning with whatever vector instructions it has
+    auto* bytes = reinterpret_cast<const uint8*> (begin());
+
+    return bytes[0] == value
+            && memcmp (bytes, bytes + 1, size - 1) == 0;
 }
 
 //==============================================================================
@@ -141,14 +161,18 @@ void MemoryBlock::setSize (const size_t newSize, const bool initialiseToZero)
         {
             if (data != nullptr)
             {
-                data.realloc (newSize);
+                // Growing into space that's already been reserved by append or insert
+                // doesn't need a reallocation
+                if (newSize < size || headOffset + newSize > allocatedSize)
+                    reallocate (newSize);
 
                 if (initialiseToZero && (newSize > size))
-                    zeromem (data + size, newSize - size);
+                    zeromem (begin() + size, newSize - size);
             }
             else
             {
                 data.allocate (newSize, initialiseToZero);
+                allocatedSize = newSize;
             }
 
             size = newSize;
@@ -160,6 +184,32 @@ void MemoryBlock::reset()
 {
     data.free();
     size = 0;
+    allocatedSize = 0;
+    headOffset = 0;
+}
+
+void MemoryBlock::compact (size_t numBytesToKeep) noexcept
+{
+    if (headOffset > 0)
+    {
+        memmove (data, data + headOffset, numBytesToKeep);
+        headOffset = 0;
+    }
+}
+
+void MemoryBlock::reallocate (size_t newAllocatedSize)
+{
+    compact (jmin (size, newAllocatedSize));
+    data.realloc (newAllocatedSize);
+    allocatedSize = newAllocatedSize;
+}
+
+void MemoryBlock::growAllocation (size_t minimumSize)
+{
+    // Over-allocating by half means that a block built up from lots of small
+    // appends only gets reallocated a logarithmic number of times
+    if (headOffset + minimumSize > allocatedSize)
+        reallocate (jmax (minimumSize, size + size / 2));
 }
 
 void MemoryBlock::ensureSize (size_t minimumSize, bool initialiseToZero)
@@ -171,13 +221,42 @@ void MemoryBlock::ensureSize (size_t minimumSize, bool initialiseToZero)
 void MemoryBlock::swapWith (MemoryBlock& other) noexcept
 {
     std::swap (size, other.size);
+    std::swap (allocatedSize, other.allocatedSize);
+    std::swap (headOffset, other.headOffset);
     data.swapWith (other.data);
 }
 
 //==============================================================================
 void MemoryBlock::fillWith (uint8 value) noexcept
 {
-    memset (data, (int) value, size);
+   #if JUCE_CORE_HAS_SSE2
+    // Blocks much bigger than the caches are filled with streaming stores: there's no point
+    // reading every line into the cache just to overwrite it, evicting everything else on the way
+    if (size >= 8 * 1024 * 1024)
+    {
+        auto* dest = begin();
+        auto* end = dest + size;
+        auto* alignedDest = snapPointerToAlignment (dest, (size_t) 64);
+
+        memset (dest, (int) value, (size_t) (alignedDest - dest));
+
+        const auto values = _mm_set1_epi8 ((char) value);
+
+        for (; alignedDest + 64 <= end; alignedDest += 64)
+        {
+            _mm_stream_si128 (reinterpret_cast<__m128i*> (alignedDest),      values);
+            _mm_stream_si128 (reinterpret_cast<__m128i*> (alignedDest + 16), values);
+            _mm_stream_si128 (reinterpret_cast<__m128i*> (alignedDest + 32), values);
+            _mm_stream_si128 (reinterpret_cast<__m128i*> (alignedDest + 48), values);
+        }
+
+        _mm_sfence();
+        memset (alignedDest, (int) value, (size_t) (end - alignedDest));
+        return;
+    }
+   #endif
+
+    memset (getData(), (int) value, size);
 }
 
 void MemoryBlock::append (const void* srcData, size_t numBytes)
@@ -186,8 +265,9 @@ void MemoryBlock::append (const void* srcData, size_t numBytes)
     {
         jassert (srcData != nullptr); // this must not be null!
         auto oldSize = size;
-        setSize (size + numBytes);
-        memcpy (data + oldSize, srcData, numBytes);
+        growAllocation (size + numBytes);
+        size += numBytes;
+        memcpy (begin() + oldSize, srcData, numBytes);
     }
 }
 
@@ -200,7 +280,27 @@ void MemoryBlock::replaceAll (const void* srcData, size_t numBytes)
     }
 
     jassert (srcData != nullptr); // this must not be null!
-    setSize (numBytes);
+
+    // The current contents are about to be overwritten, so when growing there's no
+    // point letting realloc copy them across to the new allocation.
+    headOffset = 0;
+
+    if (numBytes > allocatedSize)
+    {
+        data.malloc (numBytes);
+        size = numBytes;
+        allocatedSize = numBytes;
+    }
+    else if (numBytes > size)
+    {
+        // There's already enough space reserved (e.g. by earlier appends), so just use it
+        size = numBytes;
+    }
+    else
+    {
+        setSize (numBytes);
+    }
+
     memcpy (data, srcData, numBytes);
 }
 
@@ -210,28 +310,53 @@ void MemoryBlock::insert (const void* srcData, size_t numBytes, size_t insertPos
     {
         jassert (srcData != nullptr); // this must not be null!
         insertPosition = jmin (size, insertPosition);
+
+        // Space freed up by removing bytes from the front can be handed straight back
+        if (insertPosition == 0 && numBytes <= headOffset)
+        {
+            headOffset -= numBytes;
+            size += numBytes;
+            memcpy (begin(), srcData, numBytes);
+            return;
+        }
+
         auto trailingDataSize = size - insertPosition;
-        setSize (size + numBytes, false);
+        growAllocation (size + numBytes);
+        size += numBytes;
 
         if (trailingDataSize > 0)
-            memmove (data + insertPosition + numBytes,
-                     data + insertPosition,
+            memmove (begin() + insertPosition + numBytes,
+                     begin() + insertPosition,
                      trailingDataSize);
 
-        memcpy (data + insertPosition, srcData, numBytes);
+        memcpy (begin() + insertPosition, srcData, numBytes);
     }
 }
 
 void MemoryBlock::removeSection (size_t startByte, size_t numBytesToRemove)
 {
-    if (startByte + numBytesToRemove >= size)
+    if (startByte >= size)
+        return;
+
+    if (numBytesToRemove >= size - startByte)
     {
         setSize (startByte);
     }
+    else if (startByte == 0 && numBytesToRemove > 0)
+    {
+        // Trimming the front just moves the start of the block forward. Once the unused
+        // space at the front outgrows the data itself, the data gets moved down and the
+        // allocation shrunk, so each removed byte is only paid for a constant number of times.
+        headOffset += numBytesToRemove;
+        size -= numBytesToRemove;
+
+        if (headOffset >= size)
+            reallocate (size);
+    }
     else if (numBytesToRemove > 0)
     {
-        memmove (data + startByte,
-                 data + startByte + numBytesToRemove,
+        memmove (begin() + startByte,
+                 begin() + startByte + numBytesToRemove,
                  size - (startByte + numBytesToRemove));
 
         setSize (size - numBytesToRemove);
@@ -244,16 +369,24 @@ void MemoryBlock::copyFrom (const void* const src, int offset, size_t num) noexc
 
     if (offset < 0)
     {
-        d -= offset;
-        num += (size_t) -offset;
+        // The start of the source lands before the block, so skip over it
+        auto numToSkip = (size_t) -(int64) offset;
+
+        if (num <= numToSkip)
+            return;
+
+        d += numToSkip;
+        num -= numToSkip;
         offset = 0;
     }
 
-    if ((size_t) offset + num > size)
-        num = size - (size_t) offset;
+    if ((size_t) offset >= size)
+        return;
+
+    num = jmin (num, size - (size_t) offset);
 
     if (num > 0)
-        memcpy (data + offset, d, num);
+        memcpy (begin() + offset, d, num);
 }
 
 void MemoryBlock::copyTo (void* const dst, int offset, size_t num) const noexcept
@@ -262,109 +395,144 @@ void MemoryBlock::copyTo (void* const dst, int offset, size_t num) const noexcep
 
     if (offset < 0)
     {
-        zeromem (d, (size_t) -offset);
-        d -= offset;
-        num -= (size_t) -offset;
+        auto numToZero = jmin (num, (size_t) -(int64) offset);
+        zeromem (d, numToZero);
+        d += numToZero;
+        num -= numToZero;
         offset = 0;
     }
 
-    if ((size_t) offset + num > size)
+    auto numAvailable = (size_t) offset < size ? size - (size_t) offset : 0;
+
+    if (num > numAvailable)
     {
-        auto newNum = (size_t) size - (size_t) offset;
-        zeromem (d + newNum, num - newNum);
-        num = newNum;
+        zeromem (d + numAvailable, num - numAvailable);
+        num = numAvailable;
     }
 
     if (num > 0)
-        memcpy (d, data + offset, num);
+        memcpy (d, begin() + offset, num);
 }
 
 String MemoryBlock::toString() const
 {
-    return String::fromUTF8 (data, (int) size);
+    if (size == 0)
+        return {};
+
+    // Anything after a terminating zero isn't part of the string, so there's no
+    // point validating it, copying it, or keeping it allocated inside the result
+    auto* terminator = static_cast<const char*> (memchr (begin(), 0, size));
+    auto numBytes = terminator != nullptr ? (size_t) (terminator - begin()) : size;
+
+    return String::fromUTF8 (begin(), (int) numBytes);
 }
 
 //==============================================================================
+// A range of up to 32 bits starting part-way through a byte spans at most 5 bytes, so
+// both of these work on the whole range at once as a 64-bit little-endian word
 int MemoryBlock::getBitRange (size_t bitRangeStart, size_t numBits) const noexcept
 {
-    int res = 0;
+    jassert (numBits <= 32);
 
     auto byte = bitRangeStart >> 3;
-    auto offsetInByte = bitRangeStart & 7;
-    size_t bitsSoFar = 0;
 
-    while (numBits > 0 && (size_t) byte < size)
-    {
-        auto bitsThisTime = jmin (numBits, 8 - offsetInByte);
-        const int mask = (0xff >> (8 - bitsThisTime)) << offsetInByte;
+    if (numBits == 0 || byte >= size)
+        return 0;
 
-        res |= (((data[byte] & mask) >> offsetInByte) << bitsSoFar);
+    auto offsetInByte = bitRangeStart & 7;
+    auto numBytes = jmin ((offsetInByte + numBits + 7) >> 3, size - byte);
+    auto* source = reinterpret_cast<const uint8*> (begin()) + byte;
 
-        bitsSoFar += bitsThisTime;
-        numBits -= bitsThisTime;
-        ++byte;
-        offsetInByte = 0;
-    }
+    uint64 bits = 0;
+
+    for (size_t i = 0; i < numBytes; ++i)
+        bits |= (uint64) source[i] << (i * 8);
 
-    return res;
+    const auto mask = ((uint64) 1 << numBits) - 1;
+    return (int) (uint32) ((bits >> offsetInByte) & mask);
 }
 
 void MemoryBlock::setBitRange (const size_t bitRangeStart, size_t numBits, int bitsToSet) noexcept
 {
+    jassert (numBits <= 32);
+
     auto byte = bitRangeStart >> 3;
-    auto offsetInByte = bitRangeStart & 7;
-    uint32 mask = ~((((uint32) 0xffffffff) << (32 - numBits)) >> (32 - numBits));
 
-    while (numBits > 0 && (size_t) byte < size)
-    {
-        auto bitsThisTime = jmin (numBits, 8 - offsetInByte);
+    if (numBits == 0 || byte >= size)
+        return;
 
-        const uint32 tempMask = (mask << offsetInByte) | ~((((uint32) 0xffffffff) >> offsetInByte) << offsetInByte);
-        const uint32 tempBits = (uint32) bitsToSet << offsetInByte;
+    auto offsetInByte = bitRangeStart & 7;
+    auto numBytes = jmin ((offsetInByte + numBits + 7) >> 3, size - byte);
+    auto* dest = reinterpret_cast<uint8*> (begin()) + byte;
 
-        data[byte] = (char) (((uint32) data[byte] & tempMask) | tempBits);
+    // Any bits of the value beyond numBits are dropped rather than written over the neighbours
+    const auto mask = (((uint64) 1 << numBits) - 1) << offsetInByte;
+    const auto bits = ((uint64) (uint32) bitsToSet << offsetInByte) & mask;
 
-        ++byte;
-        numBits -= bitsThisTime;
-        bitsToSet >>= bitsThisTime;
-        mask >>= bitsThisTime;
-        offsetInByte = 0;
+    for (size_t i = 0; i < numBytes; ++i)
+    {
+        const auto byteMask = (uint8) (mask >> (i * 8));
+        dest[i] = (uint8) ((dest[i] & ~byteMask) | (uint8) (bits >> (i * 8)));
     }
 }
 
 //==============================================================================
+static const uint8 hexDigitTable[] =
+{
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35
+};
+
 void MemoryBlock::loadFromHexString (StringRef hex)
 {
-    ensureSize ((size_t) hex.length() >> 1);
-    char* dest = data;
-    auto t = hex.text;
+    // The number of code units is a cheap upper bound on the number of digits, and the
+    // old contents are about to be overwritten, so there's no need to preserve them
+    auto numCodeUnits = hex.text.sizeInBytes() / sizeof (*hex.text.getAddress()) - 1;
+    auto maxNumBytes = numCodeUnits >> 1;
 
-    for (;;)
+    headOffset = 0;
+
+    if (maxNumBytes > allocatedSize)
     {
-        juce_wchar byte = 0;
+        data.malloc (maxNumBytes);
+        allocatedSize = maxNumBytes;
+    }
 
-        for (int loop = 2; --loop >= 0;)
-        {
-            byte <<= 4;
+    size = maxNumBytes;
+    auto* dest = begin();
 
-            for (;;)
-            {
-                auto c = t.getAndAdvance();
+    // Hex digits are always ASCII, and no multi-unit UTF-8/16 sequence contains an ASCII
+    // code unit, so the raw units can be scanned directly without decoding the string
+    uint32 byte = 0;
+    bool haveHighNibble = false;
 
-                if (c >= '0' && c <= '9')    { byte |= c - '0';        break; }
-                if (c >= 'a' && c <= 'z')    { byte |= c - ('a' - 10); break; }
-                if (c >= 'A' && c <= 'Z')    { byte |= c - ('A' - 10); break; }
+    for (auto* t = hex.text.getAddress(); *t != 0; ++t)
+    {
+        auto index = (uint32) *t - (uint32) '0';
 
-                if (c == 0)
-                {
-                    setSize (static_cast<size_t> (dest - data));
-                    return;
-                }
-            }
+        if (index >= (uint32) numElementsInArray (hexDigitTable))
+            continue;
+
+        auto nibble = hexDigitTable[index];
+
+        if (nibble == 0xff)
+            continue;
+
+        byte = (byte << 4) | nibble;
+
+        if (haveHighNibble)
+        {
+            *dest++ = (char) byte;
+            byte = 0;
         }
 
-        *dest++ = (char) byte;
+        haveHighNibble = ! haveHighNibble;
     }
+
+    setSize (static_cast<size_t> (dest - begin()));
 }
 
 //==============================================================================
@@ -382,8 +550,35 @@ String MemoryBlock::toBase64Encoding() const
     d += initialLen;
     d.write ('.');
 
-    for (size_t i = 0; i < numChars; ++i)
-        d.write ((juce_wchar) (uint8) base64EncodingTable[getBitRange (i * 6, 6)]);
+    // The bits are packed least-significant first, so every 3 bytes of input
+    // produce exactly 4 characters: encode whole 24-bit groups at a time..
+    auto* source = reinterpret_cast<const uint8*> (begin());
+    size_t i = 0;
+
+    for (; i + 3 <= size; i += 3)
+    {
+        const auto bits = (uint32) source[i] | ((uint32) source[i + 1] << 8) | ((uint32) source[i + 2] << 16);
+
+        d.write ((juce_wchar) (uint8) base64EncodingTable[bits & 63]);
+        d.write ((juce_wchar) (uint8) base64EncodingTable[(bits >> 6) & 63]);
+        d.write ((juce_wchar) (uint8) base64EncodingTable[(bits >> 12) & 63]);
+        d.write ((juce_wchar) (uint8) base64EncodingTable[bits >> 18]);
+    }
+
+    // ..and then the remaining 1 or 2 bytes, which need 2 or 3 characters
+    if (i < size)
+    {
+        auto bits = (uint32) source[i];
+
+        if (i + 1 < size)
+            bits |= (uint32) source[i + 1] << 8;
+
+        for (auto numCharsLeft = numChars - (i / 3) * 4; numCharsLeft > 0; --numCharsLeft)
+        {
+            d.write ((juce_wchar) (uint8) base64EncodingTable[bits & 63]);
+            bits >>= 6;
+        }
+    }
 
     d.writeNull();
     return destString;
@@ -408,23 +603,43 @@ bool MemoryBlock::fromBase64Encoding (StringRef s)
     setSize ((size_t) numBytesNeeded, true);
 
     auto srcChars = dot + 1;
-    int pos = 0;
+    auto* dest = reinterpret_cast<uint8*> (begin());
+    size_t byteIndex = 0;
+
+    // Collect the 6-bit values into an accumulator, and write out whole bytes
+    // as soon as they're complete
+    uint32 bits = 0;
+    int numBits = 0;
 
     for (;;)
     {
         auto c = (int) srcChars.getAndAdvance();
 
         if (c == 0)
-            return true;
+            break;
 
         c -= 43;
 
         if (isPositiveAndBelow (c, numElementsInArray (base64DecodingTable)))
         {
-            setBitRange ((size_t) pos, 6, base64DecodingTable[c]);
-            pos += 6;
+            bits |= (uint32) base64DecodingTable[c] << numBits;
+            numBits += 6;
+
+            if (numBits >= 8)
+            {
+                if (byteIndex < size)
+                    dest[byteIndex++] = (uint8) bits;
+
+                bits >>= 8;
+                numBits -= 8;
+            }
         }
     }
+
+    if (numBits > 0)
+        setBitRange (byteIndex * 8, (size_t) numBits, (int) bits);
+
+    return true;
 }
 
 } // namespace juce
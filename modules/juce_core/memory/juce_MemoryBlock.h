@@ -99,36 +99,42 @@ public:
     /** Returns true if the data in this MemoryBlock matches the raw bytes passed-in. */
     bool matches (const void* data, size_t dataSize) const noexcept;
 
+    /** Returns true if every byte in the block has the given value.
+        An empty block will always return true.
+        @see fillWith
+    */
+    bool containsOnly (uint8 value) const noexcept;
+
     //==============================================================================
     /** Returns a void pointer to the data.
 
         Note that the pointer returned will probably become invalid when the
         block is resized.
     */
-    void* getData() noexcept                                        { return data; }
+    void* getData() noexcept                                        { return data + headOffset; }
 
     /** Returns a void pointer to the data.
 
         Note that the pointer returned will probably become invalid when the
         block is resized.
     */
-    const void* getData() const noexcept                            { return data; }
+    const void* getData() const noexcept                            { return data + headOffset; }
 
     /** Returns a byte from the memory block.
         This returns a reference, so you can also use it to set a byte.
     */
     template <typename Type>
-    char& operator[] (const Type offset) noexcept                   { return data [offset]; }
+    char& operator[] (const Type offset) noexcept                   { return begin()[offset]; }
 
     /** Returns a byte from the memory block. */
     template <typename Type>
-    const char& operator[] (const Type offset) const noexcept       { return data [offset]; }
+    const char& operator[] (const Type offset) const noexcept       { return begin()[offset]; }
 
     /** Returns an iterator for the data. */
-    char* begin() noexcept                                          { return data; }
+    char* begin() noexcept                                          { return data + headOffset; }
 
     /** Returns an iterator for the data. */
-    const char* begin() const noexcept                              { return data; }
+    const char* begin() const noexcept                              { return data + headOffset; }
 
     /** Returns an end-iterator for the data. */
     char* end() noexcept                                            { return begin() + getSize(); }
@@ -176,6 +182,7 @@ public:
     //==============================================================================
     /** Fills the entire memory block with a repeated byte value.
         This is handy for clearing a block of memory to zero.
+        @see containsOnly
     */
     void fillWith (uint8 valueToUse) noexcept;
 
@@ -230,7 +237,9 @@ public:
 
     //==============================================================================
     /** Exchanges the contents of this and another memory block.
-        No actual copying is required for this, so it's very fast.
+        No actual copying or allocation is required for this, so it's very fast, and
+        any pointer previously obtained from getData() stays valid, but now refers to
+        the data held by the other block.
     */
     void swapWith (MemoryBlock& other) noexcept;
 
@@ -299,7 +308,12 @@ private:
     //==============================================================================
     using HeapBlockType = HeapBlock<char, true>;
     HeapBlockType data;
-    size_t size = 0;
+    size_t size = 0, allocatedSize = 0;
+    size_t headOffset = 0;
+
+    void compact (size_t numBytesToKeep) noexcept;
+    void reallocate (size_t newAllocatedSize);
+    void growAllocation (size_t minimumSize);
 
     JUCE_LEAK_DETECTOR (MemoryBlock)
 };
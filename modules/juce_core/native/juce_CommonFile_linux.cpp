@@ -74,7 +74,8 @@ bool File::isHidden() const
 
 bool File::isSymbolicLink() const
 {
-    return getNativeLinkedTarget().isNotEmpty();
+    juce_statStruct info;
+    return juce_lstat (fullPath, info) && S_ISLNK (info.st_mode);
 }
 
 String File::getNativeLinkedTarget() const
@@ -94,7 +94,27 @@ void JUCE_CALLTYPE Thread::sleep (int millisecs)
     struct timespec time;
     time.tv_sec = millisecs / 1000;
     time.tv_nsec = (millisecs % 1000) * 1000000;
-    nanosleep (&time, nullptr);
+
+   #if JUCE_LINUX || JUCE_BSD || JUCE_ANDROID
+    // Sleeping until an absolute deadline on the monotonic clock means that if a signal
+    // wakes us early, we can go straight back to sleep without the total drifting
+    struct timespec deadline;
+    clock_gettime (CLOCK_MONOTONIC, &deadline);
+    deadline.tv_sec += time.tv_sec;
+    deadline.tv_nsec += time.tv_nsec;
+
+    if (deadline.tv_nsec >= 1000000000)
+    {
+        ++deadline.tv_sec;
+        deadline.tv_nsec -= 1000000000;
+    }
+
+    while (clock_nanosleep (CLOCK_MONOTONIC, TIMER_ABSTIME, &deadline, nullptr) == EINTR)
+    {}
+   #else
+    while (nanosleep (&time, &time) != 0 && errno == EINTR)
+    {}
+   #endif
 }
 
 void JUCE_CALLTYPE Process::terminate()
@@ -217,9 +237,11 @@ namespace
    #if JUCE_LINUX || (JUCE_IOS && (! TARGET_OS_MACCATALYST) && (! __DARWIN_ONLY_64_BIT_INO_T)) // (this iOS stuff is to avoid a simulator bug)
     using juce_statStruct = struct stat64;
     #define JUCE_STAT  stat64
+    #define JUCE_LSTAT lstat64
    #else
     using juce_statStruct = struct stat;
     #define JUCE_STAT  stat
+    #define JUCE_LSTAT lstat
    #endif
 
     bool juce_stat (const String& fileName, juce_statStruct& info)
@@ -228,6 +250,13 @@ namespace
                  && JUCE_STAT (fileName.toUTF8(), &info) == 0;
     }
 
+    // Like juce_stat, but describes a symbolic link itself rather than the file it points to
+    bool juce_lstat (const String& fileName, juce_statStruct& info)
+    {
+        return fileName.isNotEmpty()
+                 && JUCE_LSTAT (fileName.toUTF8(), &info) == 0;
+    }
+
    #if ! JUCE_WASM
     // if this file doesn't exist, find a parent of it that does..
     bool juce_doStatFS (File f, struct statfs& result)
@@ -298,7 +327,10 @@ bool File::exists() const
 
 bool File::existsAsFile() const
 {
-    return exists() && ! isDirectory();
+    juce_statStruct info;
+
+    return juce_stat (fullPath, info)
+             && (info.st_mode & S_IFDIR) == 0;
 }
 
 int64 File::getSize() const
@@ -329,7 +361,8 @@ bool File::hasWriteAccess() const
         return (hasEffectiveRootFilePermissions()
              || access (fullPath.toUTF8(), W_OK) == 0);
 
-    if ((! isDirectory()) && fullPath.containsChar (getSeparatorChar()))
+    // (a path that doesn't exist can't be a directory, so there's no need to stat it again)
+    if (fullPath.containsChar (getSeparatorChar()))
         return getParentDirectory().hasWriteAccess();
 
     return false;
@@ -436,14 +469,15 @@ bool File::setFileTimesInternal (int64 modificationTime, int64 accessTime, int64
 
 bool File::deleteFile() const
 {
-    if (! isSymbolicLink())
-    {
-        if (! exists())
-            return true;
+    // A single lstat tells us whether there's anything here at all (including a dangling
+    // link), and whether it's a real directory rather than a link to one.
+    juce_statStruct info;
 
-        if (isDirectory())
-            return rmdir (fullPath.toUTF8()) == 0;
-    }
+    if (! juce_lstat (fullPath, info))
+        return true;
+
+    if (S_ISDIR (info.st_mode))
+        return rmdir (fullPath.toUTF8()) == 0;
 
     return remove (fullPath.toUTF8()) == 0;
 }
@@ -40,99 +40,263 @@
 namespace juce
 {
 
-bool Base64::convertToBase64 (OutputStream& base64Result, const void* sourceData, size_t sourceDataSize)
+namespace Base64Helpers
 {
-    static const char lookup[] = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
-    auto* source = static_cast<const uint8*> (sourceData);
+    /*  The two alphabets only differ in the characters used for 62 and 63, so the conversions
+        below are parameterised by those, plus whether the output is padded with '='.
+    */
+    struct AlphabetInfo
+    {
+        int char62, char63;
+        bool padded;
+    };
 
-    while (sourceDataSize > 0)
+    static AlphabetInfo getAlphabetInfo (Base64::Alphabet alphabet) noexcept
     {
-        char frame[4];
-        auto byte0 = *source++;
-        frame[0] = lookup [(byte0 & 0xfcu) >> 2];
-        uint32 bits = (byte0 & 0x03u) << 4;
+        if (alphabet == Base64::Alphabet::urlSafe)
+            return { '-', '_', false };
 
-        if (sourceDataSize > 1)
+        return { '+', '/', true };
+    }
+
+    /*  Maps a 6-bit value onto the alphabet without branches or table lookups: each term
+        relies on an arithmetic right shift of (limit - v) to produce an all-ones mask once v has
+        passed the end of one of the ranges A-Z, a-z, 0-9, 62.
+    */
+    static char encodeSixBits (uint32 sixBits, const AlphabetInfo& alphabet) noexcept
+    {
+        const auto v = (int) sixBits;
+
+        return (char) (v + 'A'
+                         + (((25 - v) >> 8) & 6)
+                         - (((51 - v) >> 8) & 75)
+                         - (((61 - v) >> 8) & ('0' + 10 - alphabet.char62))
+                         + (((62 - v) >> 8) & (alphabet.char63 - alphabet.char62 - 1)));
+    }
+
+    /*  The inverse of encodeSixBits: ((lower - c) & (c - upper)) >> 8 is all-ones only when c lies
+        strictly between lower and upper, so exactly one of the terms below can contribute.
+        Returns -1 for anything that isn't part of the alphabet (including the '=' padding).
+    */
+    static int decodeSixBits (juce_wchar character, const AlphabetInfo& alphabet) noexcept
+    {
+        const auto c = (int) jmin (character, (juce_wchar) 0xff);
+        const auto c62 = alphabet.char62;
+        const auto c63 = alphabet.char63;
+
+        auto result = -1;
+        result += (((0x40 - c) & (c - 0x5b)) >> 8) & (c - 64);          // A-Z
+        result += (((0x60 - c) & (c - 0x7b)) >> 8) & (c - 70);          // a-z
+        result += (((0x2f - c) & (c - 0x3a)) >> 8) & (c + 5);           // 0-9
+        result += (((c62 - 1 - c) & (c - c62 - 1)) >> 8) & 63;          // 62
+        result += (((c63 - 1 - c) & (c - c63 - 1)) >> 8) & 64;          // 63
+        return result;
+    }
+
+    template <size_t bufferSize>
+    struct BufferedWriter
+    {
+        explicit BufferedWriter (OutputStream& o) noexcept : out (o) {}
+
+        char* reserve (size_t numBytes)
         {
-            auto byte1 = *source++;
-            frame[1] = lookup[bits | ((byte1 & 0xf0u) >> 4)];
-            bits = (byte1 & 0x0fu) << 2;
+            jassert (numBytes <= bufferSize);
 
-            if (sourceDataSize > 2)
-            {
-                auto byte2 = *source++;
-                frame[2] = lookup[bits | ((byte2 & 0xc0u) >> 6)];
-                frame[3] = lookup[byte2 & 0x3fu];
-                sourceDataSize -= 3;
-            }
-            else
+            if (numUsed + numBytes > bufferSize && ! flush())
+                return nullptr;
+
+            auto* dest = buffer + numUsed;
+            numUsed += numBytes;
+            return dest;
+        }
+
+        bool flush()
+        {
+            const auto ok = numUsed == 0 || out.write (buffer, numUsed);
+            numUsed = 0;
+            return ok;
+        }
+
+        OutputStream& out;
+        char buffer[bufferSize];
+        size_t numUsed = 0;
+    };
+
+    /*  Reads single-byte characters from a stream through a fixed-size buffer, presenting
+        the same isEmpty/getAndAdvance interface as a CharPointer.
+    */
+    struct StreamCharacterSource
+    {
+        explicit StreamCharacterSource (InputStream& s) noexcept : stream (s) {}
+
+        bool isEmpty()  { return ! fillBufferIfNeeded(); }
+
+        juce_wchar getAndAdvance()
+        {
+            if (! fillBufferIfNeeded())
+                return 0;
+
+            // A zero byte mid-stream isn't the end of the input, so hand it on as
+            // a character that the decoder will reject
+            auto c = (uint8) buffer[position++];
+            return c != 0 ? (juce_wchar) c : (juce_wchar) 0xff;
+        }
+
+        bool fillBufferIfNeeded()
+        {
+            if (position >= numInBuffer)
             {
-                frame[2] = lookup[bits];
-                frame[3] = '=';
-                sourceDataSize = 0;
+                numInBuffer = jmax (0, stream.read (buffer, (int) sizeof (buffer)));
+                position = 0;
             }
+
+            return position < numInBuffer;
         }
-        else
+
+        InputStream& stream;
+        char buffer[8192];
+        int position = 0, numInBuffer = 0;
+    };
+
+    template <typename CharacterSource>
+    static bool decode (OutputStream& binaryOutput, CharacterSource& source, const AlphabetInfo& alphabet)
+    {
+        BufferedWriter<768> writer (binaryOutput);
+        bool reachedEnd = false;
+
+        while (! (reachedEnd || source.isEmpty()))
         {
-            frame[1] = lookup[bits];
-            frame[2] = '=';
-            frame[3] = '=';
-            sourceDataSize = 0;
+            int data[4];
+
+            for (int i = 0; i < 4; ++i)
+            {
+                auto c = source.getAndAdvance();
+                data[i] = decodeSixBits (c, alphabet);
+
+                if (data[i] < 0)
+                {
+                    // Unpadded input may finish part-way through its last group
+                    const auto isUnpaddedEnd = (c == 0 && ! alphabet.padded);
+
+                    if ((c != '=' && ! isUnpaddedEnd) || i <= 1)
+                    {
+                        writer.flush();
+                        return false;
+                    }
+
+                    if (isUnpaddedEnd)
+                    {
+                        for (; i < 4; ++i)
+                            data[i] = 64;
+
+                        reachedEnd = true;
+                        break;
+                    }
+
+                    data[i] = 64;
+                }
+            }
+
+            const auto numBytes = data[2] >= 64 ? 1 : (data[3] >= 64 ? 2 : 3);
+            auto* dest = writer.reserve ((size_t) numBytes);
+
+            if (dest == nullptr)
+                return false;
+
+            dest[0] = (char) ((data[0] << 2) | (data[1] >> 4));
+
+            if (numBytes > 1)  dest[1] = (char) ((data[1] << 4) | (data[2] >> 2));
+            if (numBytes > 2)  dest[2] = (char) ((data[2] << 6) | data[3]);
         }
 
-        if (! base64Result.write (frame, 4))
-            return false;
+        return writer.flush();
     }
-
-    return true;
 }
 
-bool Base64::convertFromBase64 (OutputStream& binaryOutput, StringRef base64TextInput)
+bool Base64::convertToBase64 (OutputStream& base64Result, const void* sourceData, size_t sourceDataSize, Alphabet alphabetToUse)
 {
-    for (auto s = base64TextInput.text; ! s.isEmpty();)
+    using namespace Base64Helpers;
+
+    const auto alphabet = getAlphabetInfo (alphabetToUse);
+    auto* source = static_cast<const uint8*> (sourceData);
+    BufferedWriter<1024> writer (base64Result);
+
+    // Two 24-bit groups at a time, held as a 48-bit big-endian word
+    for (; sourceDataSize >= 6; source += 6, sourceDataSize -= 6)
     {
-        uint8 data[4];
+        auto* frame = writer.reserve (8);
 
-        for (int i = 0; i < 4; ++i)
-        {
-            auto c = (uint32) s.getAndAdvance();
+        if (frame == nullptr)
+            return false;
 
-            if (c >= 'A' && c <= 'Z')         c -= 'A';
-            else if (c >= 'a' && c <= 'z')    c -= 'a' - 26;
-            else if (c >= '0' && c <= '9')    c += 52 - '0';
-            else if (c == '+')                c = 62;
-            else if (c == '/')                c = 63;
-            else if (c == '=')                { c = 64; if (i <= 1) return false; }
-            else                              return false;
+        const auto bits = ((uint64) source[0] << 40) | ((uint64) source[1] << 32) | ((uint64) source[2] << 24)
+                        | ((uint64) source[3] << 16) | ((uint64) source[4] << 8)  |  (uint64) source[5];
 
-            data[i] = (uint8) c;
-        }
+        for (int i = 0; i < 8; ++i)
+            frame[i] = encodeSixBits ((uint32) (bits >> (42 - 6 * i)) & 0x3fu, alphabet);
+    }
 
-        binaryOutput.writeByte ((char) ((data[0] << 2) | (data[1] >> 4)));
+    if (sourceDataSize > 0)
+    {
+        char frames[8];
+        size_t numChars = 0;
 
-        if (data[2] < 64)
+        while (sourceDataSize > 0)
         {
-            binaryOutput.writeByte ((char) ((data[1] << 4) | (data[2] >> 2)));
+            const auto numBytes = jmin (sourceDataSize, (size_t) 3);
+
+            uint32 bits = (uint32) source[0] << 16;
+
+            if (numBytes > 1)  bits |= (uint32) source[1] << 8;
+            if (numBytes > 2)  bits |= (uint32) source[2];
+
+            frames[numChars++] = encodeSixBits (bits >> 18, alphabet);
+            frames[numChars++] = encodeSixBits ((bits >> 12) & 0x3fu, alphabet);
 
-            if (data[3] < 64)
-                binaryOutput.writeByte ((char) ((data[2] << 6) | data[3]));
+            if (numBytes > 1)             frames[numChars++] = encodeSixBits ((bits >> 6) & 0x3fu, alphabet);
+            else if (alphabet.padded)     frames[numChars++] = '=';
+
+            if (numBytes > 2)             frames[numChars++] = encodeSixBits (bits & 0x3fu, alphabet);
+            else if (alphabet.padded)     frames[numChars++] = '=';
+
+            source += numBytes;
+            sourceDataSize -= numBytes;
         }
+
+        auto* dest = writer.reserve (numChars);
+
+        if (dest == nullptr)
+            return false;
+
+        memcpy (dest, frames, numChars);
     }
 
-    return true;
+    return writer.flush();
+}
+
+bool Base64::convertFromBase64 (OutputStream& binaryOutput, StringRef base64TextInput, Alphabet alphabetToUse)
+{
+    auto source = base64TextInput.text;
+    return Base64Helpers::decode (binaryOutput, source, Base64Helpers::getAlphabetInfo (alphabetToUse));
+}
+
+bool Base64::convertFromBase64 (OutputStream& binaryOutput, InputStream& base64Input, Alphabet alphabetToUse)
+{
+    Base64Helpers::StreamCharacterSource source (base64Input);
+    return Base64Helpers::decode (binaryOutput, source, Base64Helpers::getAlphabetInfo (alphabetToUse));
 }
 
-String Base64::toBase64 (const void* sourceData, size_t sourceDataSize)
+String Base64::toBase64 (const void* sourceData, size_t sourceDataSize, Alphabet alphabetToUse)
 {
     MemoryOutputStream m ((sourceDataSize * 4) / 3 + 3);
-    [[maybe_unused]] bool ok = convertToBase64 (m, sourceData, sourceDataSize);
+    [[maybe_unused]] bool ok = convertToBase64 (m, sourceData, sourceDataSize, alphabetToUse);
     jassert (ok); // should always succeed for this simple case
     return m.toString();
 }
 
-String Base64::toBase64 (const String& text)
+String Base64::toBase64 (const String& text, Alphabet alphabetToUse)
 {
-    return toBase64 (text.toRawUTF8(), strlen (text.toRawUTF8()));
+    return toBase64 (text.toRawUTF8(), strlen (text.toRawUTF8()), alphabetToUse);
 }
 
 
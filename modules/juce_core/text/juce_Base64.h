@@ -48,23 +48,48 @@ namespace juce
 */
 struct JUCE_API Base64
 {
+    /** The character sets that the encoder and decoder can use. */
+    enum class Alphabet
+    {
+        /** The standard alphabet from RFC 4648, using '+' and '/', with '=' padding. */
+        standard,
+
+        /** The URL and filename safe alphabet from RFC 4648, using '-' and '_'.
+            Output in this alphabet isn't padded, and the decoder accepts input
+            either with or without padding.
+        */
+        urlSafe
+    };
+
     /** Converts a binary block of data into a base-64 string.
         This will write the resulting string data to the given stream.
         If a write error occurs with the stream, the method will terminate and return false.
     */
-    static bool convertToBase64 (OutputStream& base64Result, const void* sourceData, size_t sourceDataSize);
+    static bool convertToBase64 (OutputStream& base64Result, const void* sourceData, size_t sourceDataSize,
+                                 Alphabet alphabet = Alphabet::standard);
 
     /** Converts a base-64 string back to its binary representation.
         This will write the decoded binary data to the given stream.
         If the string is not valid base-64, the method will terminate and return false.
     */
-    static bool convertFromBase64 (OutputStream& binaryOutput, StringRef base64TextInput);
+    static bool convertFromBase64 (OutputStream& binaryOutput, StringRef base64TextInput,
+                                   Alphabet alphabet = Alphabet::standard);
+
+    /** Reads base-64 text from a stream and writes its binary representation to another stream.
+        The text is consumed in small chunks as it's decoded, so the whole of it never needs
+        to be held in memory at once.
+        If the text is not valid base-64, the method will terminate and return false.
+    */
+    static bool convertFromBase64 (OutputStream& binaryOutput, InputStream& base64Input,
+                                   Alphabet alphabet = Alphabet::standard);
 
     /** Converts a block of binary data to a base-64 string. */
-    static String toBase64 (const void* sourceData, size_t sourceDataSize);
+    static String toBase64 (const void* sourceData, size_t sourceDataSize,
+                            Alphabet alphabet = Alphabet::standard);
 
     /** Converts a string's UTF-8 representation to a base-64 string. */
-    static String toBase64 (const String& textToEncode);
+    static String toBase64 (const String& textToEncode,
+                            Alphabet alphabet = Alphabet::standard);
 };
 
 } // namespace juce
@@ -514,8 +514,24 @@ public:
     /** Returns true if this data contains a valid string in this encoding. */
     static bool isValidString (const CharType* dataToTest, int maxBytesToRead)
     {
-        while (--maxBytesToRead >= 0 && *dataToTest != 0)
+        for (;;)
         {
+            // skip over runs of plain ASCII eight bytes at a time
+            while (maxBytesToRead >= 8)
+            {
+                uint64 word;
+                std::memcpy (&word, dataToTest, sizeof (word));
+
+                if (((word | ((word - 0x0101010101010101ull) & ~word)) & 0x8080808080808080ull) != 0)
+                    break;
+
+                dataToTest += 8;
+                maxBytesToRead -= 8;
+            }
+
+            if (--maxBytesToRead < 0 || *dataToTest == 0)
+                return true;
+
             auto byte = (signed char) *dataToTest++;
 
             if (byte < 0)
@@ -548,8 +564,6 @@ public:
                         return false;
             }
         }
-
-        return true;
     }
 
     /** Atomically swaps this pointer for a new value, returning the previous value. */
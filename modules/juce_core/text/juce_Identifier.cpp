@@ -82,10 +82,45 @@ Identifier::Identifier (String::CharPointerType start, String::CharPointerType e
 
 Identifier Identifier::null;
 
+namespace
+{
+
+// One bit per ASCII character, set for every character that may appear in an identifier,
+// so that each character can be classified with a single lookup instead of a search
+// through the list of legal characters.
+struct IdentifierCharacterTable
+{
+    constexpr IdentifierCharacterTable() noexcept
+    {
+        constexpr const char legalCharacters[] = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-:#@$%";
+
+        for (auto c : legalCharacters)
+            if (c != 0)
+                bits[(uint8) c >> 6] |= (uint64) 1 << ((uint8) c & 63);
+    }
+
+    constexpr bool contains (juce_wchar c) const noexcept
+    {
+        return (uint32) c < 128 && (bits[(uint32) c >> 6] & ((uint64) 1 << ((uint32) c & 63))) != 0;
+    }
+
+    uint64 bits[2] = {};
+};
+
+constexpr IdentifierCharacterTable identifierCharacters;
+
+} // namespace
+
 bool Identifier::isValidIdentifier (const String& possibleIdentifier) noexcept
 {
-    return possibleIdentifier.isNotEmpty()
-            && possibleIdentifier.containsOnly ("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-:#@$%");
+    if (possibleIdentifier.isEmpty())
+        return false;
+
+    for (auto t = possibleIdentifier.getCharPointer(); ! t.isEmpty();)
+        if (! identifierCharacters.contains (t.getAndAdvance()))
+            return false;
+
+    return true;
 }
 
 } // namespace juce
@@ -54,7 +54,7 @@ RelativeTime RelativeTime::days (double numberOfDays) noexcept              { re
 RelativeTime RelativeTime::weeks (double numberOfWeeks) noexcept            { return RelativeTime (numberOfWeeks * (60.0 * 60.0 * 24.0 * 7.0)); }
 
 //==============================================================================
-int64 RelativeTime::inMilliseconds() const noexcept { return (int64) (numSeconds * 1000.0); }
+int64 RelativeTime::inMilliseconds() const noexcept { return (int64) std::round (numSeconds * 1000.0); }
 double RelativeTime::inMinutes() const noexcept     { return numSeconds / 60.0; }
 double RelativeTime::inHours() const noexcept       { return numSeconds / (60.0 * 60.0); }
 double RelativeTime::inDays() const noexcept        { return numSeconds / (60.0 * 60.0 * 24.0); }
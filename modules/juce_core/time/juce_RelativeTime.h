@@ -108,6 +108,10 @@ public:
 
     //==============================================================================
     /** Returns the number of milliseconds this time represents.
+
+        The value is rounded to the nearest millisecond, so a RelativeTime created
+        with milliseconds() always gives back the same number here.
+
         @see milliseconds, inSeconds, inMinutes, inHours, inDays, inWeeks
     */
     int64 inMilliseconds() const noexcept;
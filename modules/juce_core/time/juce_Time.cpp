@@ -94,14 +94,6 @@ namespace TimeHelpers
        #endif
     }
 
-    static int getUTCOffsetSeconds (const int64 millis) noexcept
-    {
-        auto utc = millisToUTC (millis);
-        utc.tm_isdst = -1;  // Treat this UTC time as local to find the offset
-
-        return (int) ((millis / 1000) - (int64) mktime (&utc));
-    }
-
     static int extendedModulo (const int64 value, const int modulo) noexcept
     {
         return (int) (value >= 0 ? (value % modulo)
@@ -194,6 +186,14 @@ namespace TimeHelpers
                 + t.tm_sec;
     }
 
+    // The offset is the local wall-clock time read back as if it were UTC, minus the
+    // instant itself. That needs a single localtime call, rather than the iterative
+    // search that mktime performs, and gives the offset in force at that exact instant.
+    static int getUTCOffsetSeconds (const int64 millis) noexcept
+    {
+        return (int) (mktime_utc (millisToLocal (millis)) - millis / 1000);
+    }
+
     static Atomic<uint32> lastMSCounterValue { (uint32) 0 };
 
     static String getUTCOffsetString (int utcOffsetSeconds, bool includeSemiColon)
@@ -294,7 +294,10 @@ void Time::waitForMillisecondCounter (uint32 targetTime) noexcept
 
         if (toWait > 2)
         {
-            Thread::sleep (jmin (20, toWait >> 1));
+            // Sleep through as much of the wait as we can, leaving a couple of milliseconds
+            // to absorb the scheduler waking us up late, but never more than 20ms in one go
+            // so that a long wait still keeps re-checking the counter
+            Thread::sleep (jmin (20, toWait - 2));
         }
         else
         {
@@ -124,6 +124,17 @@ namespace XmlIdentifierChars
     }
 }
 
+// copies a run of plain character data in one go, rather than re-encoding it a character at a time..
+static void appendTextRun (MemoryOutputStream& out, String::CharPointerType start, String::CharPointerType end)
+{
+   #if JUCE_STRING_UTF_TYPE == 8
+    out.write (start.getAddress(), (size_t) (end.getAddress() - start.getAddress()));
+   #else
+    while (start != end)
+        out.appendUTF8Char (start.getAndAdvance());
+   #endif
+}
+
 std::unique_ptr<XmlElement> XmlDocument::getDocumentElement (const bool onlyReadOuterDocumentElement)
 {
     if (originalText.isEmpty() && inputSource != nullptr)
@@ -132,19 +143,50 @@ std::unique_ptr<XmlElement> XmlDocument::getDocumentElement (const bool onlyRead
 
         if (in != nullptr)
         {
-            MemoryOutputStream data;
-            data.writeFromInputStream (*in, onlyReadOuterDocumentElement ? 8192 : -1);
+            auto maxBytes = onlyReadOuterDocumentElement ? (int64) 8192 : (int64) -1;
+            auto numBytes = in->getTotalLength() - in->getPosition();
+            MemoryBlock data;
+            size_t dataSize = 0;
+
+            if (numBytes > 0 && numBytes < std::numeric_limits<int>::max())
+            {
+                // when the length is known, read straight into a block that already has room
+                // for the terminator, rather than growing it through an intermediate buffer..
+                if (maxBytes >= 0)
+                    numBytes = jmin (numBytes, maxBytes);
+
+                data.setSize ((size_t) numBytes + 1);
+
+                // some streams (e.g. network ones) can return less than was asked for, so keep
+                // going until it's all arrived or the stream stops giving us anything..
+                while (dataSize < (size_t) numBytes)
+                {
+                    auto numRead = in->read (static_cast<char*> (data.getData()) + dataSize,
+                                             (int) ((size_t) numBytes - dataSize));
+
+                    if (numRead <= 0)
+                        break;
+
+                    dataSize += (size_t) numRead;
+                }
+            }
+            else
+            {
+                dataSize = in->readIntoMemoryBlock (data, (ssize_t) maxBytes);
+                data.setSize (dataSize + 1);
+            }
+
+            data[dataSize] = 0;
 
            #if JUCE_STRING_UTF_TYPE == 8
-            if (data.getDataSize() > 2)
+            if (dataSize > 2)
             {
-                data.writeByte (0);
                 auto* text = static_cast<const char*> (data.getData());
 
                 if (CharPointer_UTF16::isByteOrderMarkBigEndian (text)
                       || CharPointer_UTF16::isByteOrderMarkLittleEndian (text))
                 {
-                    originalText = data.toString();
+                    originalText = String::createStringFromData (text, (int) dataSize);
                 }
                 else
                 {
@@ -156,7 +198,7 @@ std::unique_ptr<XmlElement> XmlDocument::getDocumentElement (const bool onlyRead
                 }
             }
            #else
-            originalText = data.toString();
+            originalText = String::createStringFromData (data.getData(), (int) dataSize);
            #endif
         }
     }
@@ -635,21 +677,33 @@ void XmlDocument::readChildElements (XmlElement& parent)
                 }
                 else
                 {
-                    for (;; ++input)
+                    for (;;)
                     {
+                        auto runStart = input;
+
+                        for (;; ++input)
+                        {
+                            auto nextChar = *input;
+
+                            if (nextChar == '<' || nextChar == '&' || nextChar == '\r' || nextChar == 0)
+                                break;
+
+                            contentShouldBeUsed = contentShouldBeUsed || ! CharacterFunctions::isWhitespace (nextChar);
+                        }
+
+                        appendTextRun (textElementContent, runStart, input);
+
                         auto nextChar = *input;
 
                         if (nextChar == '\r')
                         {
-                            nextChar = '\n';
+                            if (input[1] != '\n')
+                                textElementContent.writeByte ('\n');
 
-                            if (input[1] == '\n')
-                                continue;
+                            ++input;
+                            continue;
                         }
 
-                        if (nextChar == '<' || nextChar == '&')
-                            break;
-
                         if (nextChar == 0)
                         {
                             setLastError ("unmatched tags", false);
@@ -657,8 +711,7 @@ void XmlDocument::readChildElements (XmlElement& parent)
                             return;
                         }
 
-                        textElementContent.appendUTF8Char (nextChar);
-                        contentShouldBeUsed = contentShouldBeUsed || ! CharacterFunctions::isWhitespace (nextChar);
+                        break;
                     }
                 }
             }
@@ -82,7 +82,9 @@ void AsyncUpdater::triggerAsyncUpdate()
     // running, then you're not going to get any callbacks!
     JUCE_ASSERT_MESSAGE_MANAGER_EXISTS
 
-    if (activeMessage->shouldDeliver.compareAndSetBool (1, 0))
+    // Repeated triggers are common (e.g. a burst of sendChangeMessage calls), so check
+    // with a plain load first and only pay for the compare-and-swap when it can succeed
+    if (activeMessage->shouldDeliver.get() == 0 && activeMessage->shouldDeliver.compareAndSetBool (1, 0))
         if (! activeMessage->post())
             cancelPendingUpdate(); // if the message queue fails, this avoids getting
                                    // trapped waiting for the message to arrive
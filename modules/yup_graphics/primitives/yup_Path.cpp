@@ -70,7 +70,8 @@ void Path::moveTo (float x, float y)
             segment.x = x;
             segment.y = y;
 
-            updateBoundingBox (x, y); // TODO this is wrong
+            // the replaced point may have been the one defining an edge of the box
+            boundingBoxNeedsUpdate = true;
             return;
         }
     }
@@ -78,7 +79,7 @@ void Path::moveTo (float x, float y)
     lastSubpathIndex = static_cast<int> (data.size());
     data.emplace_back (SegmentType::MoveTo, x, y);
 
-    updateBoundingBox (x, y);
+    updateBoundingBox (data.back());
 }
 
 void Path::moveTo (const Point<float>& p)
@@ -92,7 +93,7 @@ void Path::lineTo (float x, float y)
 {
     data.emplace_back (SegmentType::LineTo, x, y);
 
-    updateBoundingBox (x, y);
+    updateBoundingBox (data.back());
 }
 
 void Path::lineTo (const Point<float>& p)
@@ -106,7 +107,7 @@ void Path::quadTo (float x, float y, float x1, float y1)
 {
     data.emplace_back (SegmentType::QuadTo, x, y, x1, y1);
 
-    updateBoundingBox (x, y);
+    updateBoundingBox (data.back());
 }
 
 void Path::quadTo (const Point<float>& p, float x1, float y1)
@@ -120,7 +121,7 @@ void Path::cubicTo (float x, float y, float x1, float y1, float x2, float y2)
 {
     data.emplace_back (SegmentType::CubicTo, x, y, x1, y1, x2, y2);
 
-    updateBoundingBox (x, y);
+    updateBoundingBox (data.back());
 }
 
 void Path::cubicTo (const Point<float>& p, float x1, float y1, float x2, float y2)
@@ -358,6 +359,12 @@ void Path::appendPath (const Path& other)
     for (const auto& segment : other)
         data.push_back (segment);
 
+    if (other.boundingBoxNeedsUpdate)
+    {
+        boundingBoxNeedsUpdate = true;
+        return;
+    }
+
     minX = jmin (minX, other.minX);
     maxX = jmax (maxX, other.maxX);
     minY = jmin (minY, other.minY);
@@ -411,6 +418,23 @@ Path& Path::transform (const AffineTransform& t)
             t.transformPoints (segment.x, segment.y, segment.x1, segment.y1, segment.x2, segment.y2);
     }
 
+    // Without rotation or shear the box corners map onto the new box, otherwise it
+    // has to be rebuilt from the transformed points the next time it's needed
+    if (! data.empty() && ! boundingBoxNeedsUpdate && t.getShearX() == 0.0f && t.getShearY() == 0.0f)
+    {
+        auto x1 = minX, y1 = minY, x2 = maxX, y2 = maxY;
+        t.transformPoints (x1, y1, x2, y2);
+
+        minX = jmin (x1, x2);
+        maxX = jmax (x1, x2);
+        minY = jmin (y1, y2);
+        maxY = jmax (y1, y2);
+    }
+    else
+    {
+        boundingBoxNeedsUpdate = true;
+    }
+
     return *this;
 }
 
@@ -424,10 +448,32 @@ Path Path::transformed (const AffineTransform& t) const
 //==============================================================================
 Rectangle<float> Path::getBoundingBox() const
 {
+    if (data.empty())
+        return {};
+
+    if (boundingBoxNeedsUpdate)
+    {
+        resetBoundingBox();
+
+        for (const auto& segment : data)
+            updateBoundingBox (segment);
+    }
+
     return { minX, minY, maxX - minX, maxY - minY };
 }
 
-void Path::updateBoundingBox (float x, float y)
+void Path::updateBoundingBox (const Segment& segment) const
+{
+    updateBoundingBox (segment.x, segment.y);
+
+    if (segment.type == SegmentType::QuadTo || segment.type == SegmentType::CubicTo)
+        updateBoundingBox (segment.x1, segment.y1);
+
+    if (segment.type == SegmentType::CubicTo)
+        updateBoundingBox (segment.x2, segment.y2);
+}
+
+void Path::updateBoundingBox (float x, float y) const
 {
     minX = jmin (minX, x);
     maxX = jmax (maxX, x);
@@ -435,12 +481,13 @@ void Path::updateBoundingBox (float x, float y)
     maxY = jmax (maxY, y);
 }
 
-void Path::resetBoundingBox()
+void Path::resetBoundingBox() const
 {
     minX = std::numeric_limits<float>::max();
-    maxX = std::numeric_limits<float>::min();
+    maxX = std::numeric_limits<float>::lowest();
     minY = std::numeric_limits<float>::max();
-    maxY = std::numeric_limits<float>::min();
+    maxY = std::numeric_limits<float>::lowest();
+    boundingBoxNeedsUpdate = false;
 }
 
 //==============================================================================
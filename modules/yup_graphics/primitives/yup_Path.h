@@ -429,7 +429,12 @@ public:
     Path transformed (const AffineTransform& t) const;
 
     //==============================================================================
-    /** Returns the bounding box of this path. */
+    /** Returns the bounding box of this path.
+
+        The box encloses every end and control point of the path, and is an empty
+        rectangle for an empty path. It is kept up to date as segments are added, so
+        calling this repeatedly on an unchanged path is cheap.
+    */
     Rectangle<float> getBoundingBox() const;
 
     //==============================================================================
@@ -529,15 +534,17 @@ public:
     };
 
 private:
-    void updateBoundingBox (float x, float y);
-    void resetBoundingBox();
+    void updateBoundingBox (float x, float y) const;
+    void updateBoundingBox (const Segment& segment) const;
+    void resetBoundingBox() const;
 
     std::vector<Segment> data;
     int lastSubpathIndex = -1;
-    float minX = std::numeric_limits<float>::max();
-    float maxX = std::numeric_limits<float>::min();
-    float minY = std::numeric_limits<float>::max();
-    float maxY = std::numeric_limits<float>::min();
+    mutable float minX = std::numeric_limits<float>::max();
+    mutable float maxX = std::numeric_limits<float>::lowest();
+    mutable float minY = std::numeric_limits<float>::max();
+    mutable float maxY = std::numeric_limits<float>::lowest();
+    mutable bool boundingBoxNeedsUpdate = false;
 };
 
 } // namespace yup
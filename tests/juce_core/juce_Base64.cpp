@@ -0,0 +1,201 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+namespace
+{
+String decode (StringRef base64, bool* succeeded = nullptr)
+{
+    MemoryOutputStream out;
+    const auto ok = Base64::convertFromBase64 (out, base64);
+
+    if (succeeded != nullptr)
+        *succeeded = ok;
+
+    return out.toString();
+}
+} // namespace
+
+TEST (Base64Tests, EncodesRfc4648Vectors)
+{
+    EXPECT_EQ (Base64::toBase64 (String()), "");
+    EXPECT_EQ (Base64::toBase64 ("f"), "Zg==");
+    EXPECT_EQ (Base64::toBase64 ("fo"), "Zm8=");
+    EXPECT_EQ (Base64::toBase64 ("foo"), "Zm9v");
+    EXPECT_EQ (Base64::toBase64 ("foob"), "Zm9vYg==");
+    EXPECT_EQ (Base64::toBase64 ("fooba"), "Zm9vYmE=");
+    EXPECT_EQ (Base64::toBase64 ("foobar"), "Zm9vYmFy");
+    EXPECT_EQ (Base64::toBase64 ("foobarbaz"), "Zm9vYmFyYmF6");
+}
+
+TEST (Base64Tests, EncodesWholeAlphabet)
+{
+    const uint8 bytes[] = { 0x00, 0x10, 0x83, 0x10, 0x51, 0x87, 0x20, 0x92, 0x8b, 0x30, 0xd3, 0x8f,
+                            0x41, 0x14, 0x93, 0x51, 0x55, 0x97, 0x61, 0x96, 0x9b, 0x71, 0xd7, 0x9f,
+                            0x82, 0x18, 0xa3, 0x92, 0x59, 0xa7, 0xa2, 0x9a, 0xab, 0xb2, 0xdb, 0xaf,
+                            0xc3, 0x1c, 0xb3, 0xd3, 0x5d, 0xb7, 0xe3, 0x9e, 0xbb, 0xf3, 0xdf, 0xbf };
+
+    EXPECT_EQ (Base64::toBase64 (bytes, sizeof (bytes)),
+               "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/");
+}
+
+TEST (Base64Tests, DecodesRfc4648Vectors)
+{
+    EXPECT_EQ (decode (""), "");
+    EXPECT_EQ (decode ("Zg=="), "f");
+    EXPECT_EQ (decode ("Zm8="), "fo");
+    EXPECT_EQ (decode ("Zm9v"), "foo");
+    EXPECT_EQ (decode ("Zm9vYg=="), "foob");
+    EXPECT_EQ (decode ("Zm9vYmE="), "fooba");
+    EXPECT_EQ (decode ("Zm9vYmFy"), "foobar");
+}
+
+TEST (Base64Tests, RejectsInvalidInput)
+{
+    bool ok = true;
+
+    decode ("Zm9", &ok);
+    EXPECT_FALSE (ok);
+
+    decode ("Zm9v!mFy", &ok);
+    EXPECT_FALSE (ok);
+
+    decode ("Z===", &ok);
+    EXPECT_FALSE (ok);
+
+    decode ("Zm9v YmFy", &ok);
+    EXPECT_FALSE (ok);
+}
+
+TEST (Base64Tests, DecodingStopsWritingAtFirstInvalidGroup)
+{
+    bool ok = true;
+    EXPECT_EQ (decode ("Zm9vYm!y", &ok), "foo");
+    EXPECT_FALSE (ok);
+}
+
+TEST (Base64Tests, RoundTripsRandomData)
+{
+    Random r (4321);
+
+    for (int size = 0; size < 300; ++size)
+    {
+        MemoryBlock original ((size_t) size);
+
+        for (int i = 0; i < size; ++i)
+            original[i] = (char) r.nextInt (256);
+
+        const auto encoded = Base64::toBase64 (original.getData(), original.getSize());
+        EXPECT_EQ (encoded.length(), ((size + 2) / 3) * 4);
+
+        MemoryOutputStream out;
+        ASSERT_TRUE (Base64::convertFromBase64 (out, encoded));
+        EXPECT_EQ (out.getMemoryBlock(), original);
+    }
+}
+
+TEST (Base64Tests, UrlSafeAlphabet)
+{
+    const uint8 bytes[] = { 0xfb, 0xff, 0xbf, 0xfe };
+
+    EXPECT_EQ (Base64::toBase64 (bytes, sizeof (bytes)), "+/+//g==");
+    EXPECT_EQ (Base64::toBase64 (bytes, sizeof (bytes), Base64::Alphabet::urlSafe), "-_-__g");
+    EXPECT_EQ (Base64::toBase64 ("foobar", Base64::Alphabet::urlSafe), "Zm9vYmFy");
+    EXPECT_EQ (Base64::toBase64 ("fooba", Base64::Alphabet::urlSafe), "Zm9vYmE");
+    EXPECT_EQ (Base64::toBase64 ("foob", Base64::Alphabet::urlSafe), "Zm9vYg");
+
+    for (auto* encoded : { "-_-__g", "-_-__g==" })
+    {
+        MemoryOutputStream out;
+        EXPECT_TRUE (Base64::convertFromBase64 (out, encoded, Base64::Alphabet::urlSafe));
+        EXPECT_TRUE (out.getMemoryBlock().matches (bytes, sizeof (bytes)));
+    }
+
+    MemoryOutputStream out;
+    EXPECT_FALSE (Base64::convertFromBase64 (out, "+/+//g==", Base64::Alphabet::urlSafe));
+    EXPECT_FALSE (Base64::convertFromBase64 (out, "-_-__g==", Base64::Alphabet::standard));
+}
+
+TEST (Base64Tests, UrlSafeRejectsTruncatedGroup)
+{
+    MemoryOutputStream out;
+    EXPECT_FALSE (Base64::convertFromBase64 (out, "Zm9vY", Base64::Alphabet::urlSafe));
+}
+
+TEST (Base64Tests, UrlSafeRoundTripsRandomData)
+{
+    Random r (1234);
+
+    for (int size = 0; size < 100; ++size)
+    {
+        MemoryBlock original ((size_t) size);
+
+        for (int i = 0; i < size; ++i)
+            original[i] = (char) r.nextInt (256);
+
+        const auto encoded = Base64::toBase64 (original.getData(), original.getSize(), Base64::Alphabet::urlSafe);
+        EXPECT_FALSE (encoded.containsAnyOf ("+/="));
+
+        MemoryOutputStream out;
+        ASSERT_TRUE (Base64::convertFromBase64 (out, encoded, Base64::Alphabet::urlSafe));
+        EXPECT_EQ (out.getMemoryBlock(), original);
+    }
+}
+
+TEST (Base64Tests, DecodesFromStream)
+{
+    Random r (5678);
+    MemoryBlock original (100000);
+
+    for (size_t i = 0; i < original.getSize(); ++i)
+        original[i] = (char) r.nextInt (256);
+
+    for (auto alphabet : { Base64::Alphabet::standard, Base64::Alphabet::urlSafe })
+    {
+        const auto encoded = Base64::toBase64 (original.getData(), original.getSize(), alphabet);
+
+        MemoryInputStream in (encoded.toRawUTF8(), encoded.getNumBytesAsUTF8(), false);
+        MemoryOutputStream out;
+        ASSERT_TRUE (Base64::convertFromBase64 (out, in, alphabet));
+        EXPECT_EQ (out.getMemoryBlock(), original);
+    }
+}
+
+TEST (Base64Tests, StreamDecodingRejectsInvalidInput)
+{
+    for (auto* text : { "Zm9", "Zm9v!mFy", "Z===" })
+    {
+        MemoryInputStream in (text, strlen (text), false);
+        MemoryOutputStream out;
+        EXPECT_FALSE (Base64::convertFromBase64 (out, in));
+    }
+
+    const char withNull[] = { 'Z', 'm', '9', 'v', 0, 'm', 'F', 'y' };
+    MemoryInputStream in (withNull, sizeof (withNull), false);
+    MemoryOutputStream out;
+    EXPECT_FALSE (Base64::convertFromBase64 (out, in, Base64::Alphabet::urlSafe));
+    EXPECT_EQ (out.toString(), "foo");
+}
@@ -0,0 +1,220 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+namespace
+{
+class FileTests : public ::testing::Test
+{
+protected:
+    void SetUp() override
+    {
+        tempFile = File::getSpecialLocation (File::tempDirectory)
+                       .getNonexistentChildFile ("yup_file_test", ".txt", false);
+    }
+
+    void TearDown() override
+    {
+        tempFile.deleteFile();
+    }
+
+    File tempFile;
+};
+} // namespace
+
+TEST_F (FileTests, LoadFileAsStringSmallFile)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("0123456789", false, false, nullptr));
+    EXPECT_EQ (tempFile.loadFileAsString(), "0123456789");
+}
+
+TEST_F (FileTests, LoadFileAsStringLargeFile)
+{
+    String text;
+
+    for (int i = 0; i < 10000; ++i)
+        text << "line " << i << " " << String::charToString (0x20ac) << "\n";
+
+    ASSERT_TRUE (tempFile.replaceWithText (text, false, false, nullptr));
+    ASSERT_GE (tempFile.getSize(), 64 * 1024);
+    EXPECT_EQ (tempFile.loadFileAsString(), text);
+}
+
+TEST_F (FileTests, LoadFileAsStringLargeFileWithInvalidUTF8)
+{
+    MemoryBlock data (100000);
+    data.fillWith ('a');
+    data[50000] = (char) 0xe9;
+
+    ASSERT_TRUE (tempFile.replaceWithData (data.getData(), data.getSize()));
+
+    const auto loaded = tempFile.loadFileAsString();
+    EXPECT_EQ (loaded.length(), 100000);
+    EXPECT_EQ (loaded[50000], (juce_wchar) 0xe9);
+}
+
+TEST_F (FileTests, LoadFileAsStringMissingFile)
+{
+    EXPECT_TRUE (tempFile.loadFileAsString().isEmpty());
+}
+
+TEST_F (FileTests, ReplaceWithDataOverwritesExistingContent)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("a much longer piece of original content", false, false, nullptr));
+    ASSERT_TRUE (tempFile.replaceWithData ("abcdefghij", 10));
+
+    EXPECT_EQ (tempFile.getSize(), 10);
+    EXPECT_EQ (tempFile.loadFileAsString(), "abcdefghij");
+
+    EXPECT_TRUE (tempFile.replaceWithData (nullptr, 0));
+    EXPECT_FALSE (tempFile.exists());
+}
+
+TEST_F (FileTests, ReplaceWithTextOverwritesExistingContent)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("first", false, false, nullptr));
+    ASSERT_TRUE (tempFile.replaceWithText ("second\nline", false, false, "\n"));
+
+    EXPECT_EQ (tempFile.loadFileAsString(), "second\nline");
+}
+
+TEST_F (FileTests, CreateOutputStreamWithDifferentBufferSizes)
+{
+    for (auto bufferSize : { (size_t) 0, (size_t) 100, (size_t) 4096, (size_t) 32768, (size_t) 1000000 })
+    {
+        for (int i = 0; i < 3; ++i)
+        {
+            tempFile.deleteFile();
+
+            {
+                auto out = tempFile.createOutputStream (bufferSize);
+                ASSERT_NE (out, nullptr);
+
+                for (int j = 0; j < 1000; ++j)
+                    out->writeText (String (j) + ",", false, false, nullptr);
+            }
+
+            const auto contents = tempFile.loadFileAsString();
+            EXPECT_TRUE (contents.startsWith ("0,1,2,"));
+            EXPECT_TRUE (contents.endsWith ("998,999,"));
+        }
+    }
+}
+
+TEST_F (FileTests, ExistsAsFileDistinguishesFilesFromDirectories)
+{
+    EXPECT_FALSE (tempFile.existsAsFile());
+
+    ASSERT_TRUE (tempFile.create());
+    EXPECT_TRUE (tempFile.existsAsFile());
+    EXPECT_FALSE (tempFile.isDirectory());
+
+    EXPECT_TRUE (tempFile.getParentDirectory().exists());
+    EXPECT_FALSE (tempFile.getParentDirectory().existsAsFile());
+}
+
+TEST_F (FileTests, HasWriteAccessForNonexistentFileChecksParent)
+{
+    EXPECT_FALSE (tempFile.exists());
+    EXPECT_EQ (tempFile.hasWriteAccess(), tempFile.getParentDirectory().hasWriteAccess());
+}
+
+#if JUCE_LINUX || JUCE_MAC || JUCE_BSD
+TEST_F (FileTests, SymbolicLinks)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("target", false, false, nullptr));
+
+    const auto link = tempFile.getSiblingFile (tempFile.getFileName() + "_link");
+    link.deleteFile();
+
+    ASSERT_TRUE (tempFile.createSymbolicLink (link, true));
+    EXPECT_TRUE (link.isSymbolicLink());
+    EXPECT_FALSE (tempFile.isSymbolicLink());
+    EXPECT_EQ (link.getLinkedTarget(), tempFile);
+    EXPECT_EQ (link.loadFileAsString(), "target");
+
+    // deleting a link must leave its target alone
+    EXPECT_TRUE (link.deleteFile());
+    EXPECT_FALSE (link.isSymbolicLink());
+    EXPECT_TRUE (tempFile.existsAsFile());
+}
+
+TEST_F (FileTests, DeleteDanglingSymbolicLink)
+{
+    const auto link = tempFile.getSiblingFile (tempFile.getFileName() + "_dangling");
+    link.deleteFile();
+
+    ASSERT_TRUE (tempFile.createSymbolicLink (link, true));
+    EXPECT_TRUE (link.isSymbolicLink());
+    EXPECT_FALSE (link.exists());
+
+    EXPECT_TRUE (link.deleteFile());
+    EXPECT_FALSE (link.isSymbolicLink());
+}
+
+TEST_F (FileTests, DeleteDirectory)
+{
+    ASSERT_TRUE (tempFile.createDirectory());
+    EXPECT_TRUE (tempFile.isDirectory());
+
+    EXPECT_TRUE (tempFile.deleteFile());
+    EXPECT_FALSE (tempFile.exists());
+    EXPECT_TRUE (tempFile.deleteFile());
+}
+#endif
+
+#if ! JUCE_WINDOWS
+TEST (FilePathTests, ConstructorNormalisesSeparators)
+{
+    EXPECT_EQ (File ("/a/b/c").getFullPathName(), "/a/b/c");
+    EXPECT_EQ (File ("/a//b///c").getFullPathName(), "/a/b/c");
+    EXPECT_EQ (File ("///a").getFullPathName(), "/a");
+    EXPECT_EQ (File ("/a/b/").getFullPathName(), "/a/b");
+    EXPECT_EQ (File ("//server/share//dir").getFullPathName(), "//server/share/dir");
+    EXPECT_EQ (File ("/a/./b/../c").getFullPathName(), "/a/c");
+}
+
+TEST (FilePathTests, AddTrailingSeparator)
+{
+    EXPECT_EQ (File::addTrailingSeparator ("/a/b"), "/a/b/");
+    EXPECT_EQ (File::addTrailingSeparator ("/a/b/"), "/a/b/");
+    EXPECT_EQ (File::addTrailingSeparator (""), "/");
+}
+
+TEST (FilePathTests, GetChildFile)
+{
+    const File dir ("/a/b");
+
+    EXPECT_EQ (dir.getChildFile ("c").getFullPathName(), "/a/b/c");
+    EXPECT_EQ (dir.getChildFile ("c/d.txt").getFullPathName(), "/a/b/c/d.txt");
+    EXPECT_EQ (dir.getChildFile ("./c").getFullPathName(), "/a/b/c");
+    EXPECT_EQ (dir.getChildFile ("../c").getFullPathName(), "/a/c");
+    EXPECT_EQ (dir.getChildFile ("c//d").getFullPathName(), "/a/b/c/d");
+    EXPECT_EQ (dir.getChildFile ("/x/y").getFullPathName(), "/x/y");
+    EXPECT_EQ (File ("/").getChildFile ("c").getFullPathName(), "/c");
+    EXPECT_EQ (dir.getChildFile ("").getFullPathName(), "/a/b");
+}
+#endif
@@ -95,6 +95,12 @@ TEST (Identifier, IsValidIdentifier)
     EXPECT_TRUE(Identifier::isValidIdentifier("123"));
     EXPECT_TRUE(Identifier::isValidIdentifier("_123"));
     EXPECT_FALSE(Identifier::isValidIdentifier("_1 23"));
+    EXPECT_FALSE(Identifier::isValidIdentifier(""));
+    EXPECT_TRUE(Identifier::isValidIdentifier("ns:name-with#special@chars$100%"));
+    EXPECT_FALSE(Identifier::isValidIdentifier("dotted.name"));
+    EXPECT_FALSE(Identifier::isValidIdentifier("tab\tname"));
+    EXPECT_FALSE(Identifier::isValidIdentifier(String ("caf") + String::charToString (0xe9)));
+    EXPECT_FALSE(Identifier::isValidIdentifier(String::charToString (0x100 + 'a')));
 }
 
 TEST (Identifier, ConversionToStringRef)
@@ -0,0 +1,62 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+TEST (JSONTests, EscapeStringLeavesPlainTextUntouched)
+{
+    EXPECT_EQ (JSON::escapeString (""), "");
+    EXPECT_EQ (JSON::escapeString ("abc"), "abc");
+    EXPECT_EQ (JSON::escapeString ("The quick brown fox jumps over the lazy dog"), "The quick brown fox jumps over the lazy dog");
+}
+
+TEST (JSONTests, EscapeStringEscapesSpecialCharacters)
+{
+    EXPECT_EQ (JSON::escapeString ("\"quoted\""), "\\\"quoted\\\"");
+    EXPECT_EQ (JSON::escapeString ("back\\slash"), "back\\\\slash");
+    EXPECT_EQ (JSON::escapeString ("line1\nline2\r\n"), "line1\\nline2\\r\\n");
+    EXPECT_EQ (JSON::escapeString ("\t\b\f\a"), "\\t\\b\\f\\a");
+    EXPECT_EQ (JSON::escapeString (String::charToString (0x1f)), "\\u001f");
+    EXPECT_EQ (JSON::escapeString (String::charToString (0x7f)), "\\u007f");
+}
+
+TEST (JSONTests, EscapeStringEscapesCharactersAtAnyOffset)
+{
+    const String padding ("0123456789abcdef");
+
+    for (int i = 0; i < padding.length(); ++i)
+    {
+        const auto prefix = padding.substring (0, i);
+        EXPECT_EQ (JSON::escapeString (prefix + "\"" + padding), prefix + "\\\"" + padding);
+        EXPECT_EQ (JSON::escapeString (prefix + "\n"), prefix + "\\n");
+    }
+}
+
+TEST (JSONTests, EscapeStringEscapesNonAsciiCharacters)
+{
+    EXPECT_EQ (JSON::escapeString (String::charToString (0xe9)), "\\u00e9");
+    EXPECT_EQ (JSON::escapeString ("abcdefgh" + String::charToString (0x20ac) + "ijklmnop"), "abcdefgh\\u20acijklmnop");
+    EXPECT_EQ (JSON::escapeString (String::charToString (0x1f600)), "\\ud83d\\ude00");
+}
@@ -0,0 +1,589 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+namespace
+{
+MemoryBlock makeSequence (size_t numBytes)
+{
+    MemoryBlock block (numBytes);
+
+    for (size_t i = 0; i < numBytes; ++i)
+        block[i] = (char) (i & 0xff);
+
+    return block;
+}
+} // namespace
+
+TEST (MemoryBlockTests, SetSizeRetainsExistingData)
+{
+    auto block = makeSequence (5);
+    block.setSize (10, true);
+
+    EXPECT_EQ (block.getSize(), 10u);
+    EXPECT_EQ (makeSequence (5), MemoryBlock (block.getData(), 5));
+
+    for (size_t i = 5; i < 10; ++i)
+        EXPECT_EQ (block[i], 0);
+
+    block.setSize (3);
+    EXPECT_EQ (block, makeSequence (3));
+
+    block.setSize (0);
+    EXPECT_TRUE (block.isEmpty());
+}
+
+TEST (MemoryBlockTests, ReplaceAllGrowsAndShrinks)
+{
+    MemoryBlock block (4, true);
+
+    const auto large = makeSequence (300000);
+    block.replaceAll (large.getData(), large.getSize());
+    EXPECT_EQ (block, large);
+
+    const auto small = makeSequence (7);
+    block.replaceAll (small.getData(), small.getSize());
+    EXPECT_EQ (block, small);
+
+    block.replaceAll (small.getData(), 0);
+    EXPECT_TRUE (block.isEmpty());
+}
+
+TEST (MemoryBlockTests, ReplaceAllReusesExistingAllocation)
+{
+    const auto original = makeSequence (100);
+    MemoryBlock block;
+
+    for (size_t i = 0; i < original.getSize(); ++i)
+        block.append (original.begin() + i, 1);
+
+    const auto* storage = block.getData();
+    block.removeSection (0, 10);
+
+    const auto replacement = makeSequence (95);
+    block.replaceAll (replacement.getData(), replacement.getSize());
+    EXPECT_EQ (block, replacement);
+    EXPECT_EQ (block.getData(), storage);
+}
+
+TEST (MemoryBlockTests, CopyAssignment)
+{
+    auto source = makeSequence (1000);
+    MemoryBlock dest (10, true);
+
+    dest = source;
+    EXPECT_EQ (dest, source);
+
+    dest = MemoryBlock();
+    EXPECT_TRUE (dest.isEmpty());
+}
+
+TEST (MemoryBlockTests, ToBase64Encoding)
+{
+    const uint8 bytes[] = { 1, 2, 3, 4, 5 };
+    MemoryBlock block (bytes, sizeof (bytes));
+
+    EXPECT_EQ (block.toBase64Encoding(), "5.AHv.DT.");
+    EXPECT_EQ (MemoryBlock().toBase64Encoding(), "0.");
+}
+
+TEST (MemoryBlockTests, FromBase64Encoding)
+{
+    MemoryBlock block;
+    ASSERT_TRUE (block.fromBase64Encoding ("5.AHv.DT."));
+
+    const uint8 expected[] = { 1, 2, 3, 4, 5 };
+    EXPECT_EQ (block, MemoryBlock (expected, sizeof (expected)));
+
+    EXPECT_FALSE (block.fromBase64Encoding ("no dot here"));
+}
+
+TEST (MemoryBlockTests, Base64RoundTrip)
+{
+    Random r (1234);
+
+    for (int size = 0; size < 100; ++size)
+    {
+        MemoryBlock original (size);
+
+        for (int i = 0; i < size; ++i)
+            original[i] = (char) r.nextInt (256);
+
+        MemoryBlock decoded (7, true);
+        ASSERT_TRUE (decoded.fromBase64Encoding (original.toBase64Encoding()));
+        EXPECT_EQ (decoded, original);
+    }
+}
+
+TEST (MemoryBlockTests, FromBase64EncodingIgnoresUnknownCharacters)
+{
+    MemoryBlock block;
+    ASSERT_TRUE (block.fromBase64Encoding ("5.AH v.\nDT."));
+
+    const uint8 expected[] = { 1, 2, 3, 4, 5 };
+    EXPECT_EQ (block, MemoryBlock (expected, sizeof (expected)));
+}
+
+TEST (MemoryBlockTests, LoadFromHexString)
+{
+    MemoryBlock mb;
+    mb.loadFromHexString ("48656C6C6F20576F726C64");
+    EXPECT_EQ (mb.toString(), "Hello World");
+
+    mb.loadFromHexString ("68656c6c6f");
+    EXPECT_EQ (mb.toString(), "hello");
+
+    mb.loadFromHexString (String());
+    EXPECT_TRUE (mb.isEmpty());
+}
+
+TEST (MemoryBlockTests, LoadFromHexStringSkipsSeparators)
+{
+    MemoryBlock mb;
+    mb.loadFromHexString (CharPointer_UTF8 ("48 65-6c:6C\n6f \xc3\xa9"));
+    EXPECT_EQ (mb.toString(), "Hello");
+
+    // A trailing unpaired nibble is dropped
+    mb.loadFromHexString ("48656");
+    EXPECT_EQ (mb.getSize(), (size_t) 2);
+    EXPECT_EQ (mb.toString(), "He");
+}
+
+TEST (MemoryBlockTests, LoadFromHexStringMatchesToHexString)
+{
+    const auto original = makeSequence (256);
+
+    MemoryBlock mb;
+    mb.loadFromHexString (String::toHexString (original.getData(), (int) original.getSize()));
+    EXPECT_EQ (mb, original);
+}
+
+TEST (MemoryBlockTests, RemoveSection)
+{
+    auto mb = makeSequence (10);
+    mb.removeSection (2, 3);
+
+    const char expected[] = { 0, 1, 5, 6, 7, 8, 9 };
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+
+    mb.removeSection (0, 0);
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+}
+
+TEST (MemoryBlockTests, RemoveSectionClipsToBlock)
+{
+    auto mb = makeSequence (10);
+    mb.removeSection (6, 100);
+    EXPECT_EQ (mb, makeSequence (6));
+
+    mb.removeSection (4, std::numeric_limits<size_t>::max());
+    EXPECT_EQ (mb, makeSequence (4));
+
+    mb.removeSection (20, 5);
+    EXPECT_EQ (mb, makeSequence (4));
+}
+
+TEST (MemoryBlockTests, Insert)
+{
+    auto mb = makeSequence (4);
+    const char extra[] = { 'a', 'b' };
+
+    mb.insert (extra, sizeof (extra), 2);
+    const char expected[] = { 0, 1, 'a', 'b', 2, 3 };
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+
+    mb.insert (extra, sizeof (extra), 100);
+    const char expectedAtEnd[] = { 0, 1, 'a', 'b', 2, 3, 'a', 'b' };
+    EXPECT_TRUE (mb.matches (expectedAtEnd, sizeof (expectedAtEnd)));
+}
+
+TEST (MemoryBlockTests, RemoveSectionFromFront)
+{
+    const auto original = makeSequence (1000);
+    auto mb = original;
+
+    for (size_t removed = 0; removed < 990; removed += 3)
+    {
+        EXPECT_TRUE (mb.matches (original.begin() + removed, original.getSize() - removed));
+        mb.removeSection (0, 3);
+    }
+
+    EXPECT_TRUE (mb.matches (original.begin() + 990, 10));
+
+    mb.append (original.getData(), 5);
+    EXPECT_EQ (mb.getSize(), (size_t) 15);
+    EXPECT_EQ (memcmp (mb.begin(), original.begin() + 990, 10), 0);
+    EXPECT_EQ (memcmp (mb.begin() + 10, original.begin(), 5), 0);
+}
+
+TEST (MemoryBlockTests, InsertAtFrontAfterRemovingFromFront)
+{
+    const auto original = makeSequence (100);
+    auto mb = original;
+
+    mb.removeSection (0, 10);
+    mb.insert (original.getData(), 10, 0);
+    EXPECT_EQ (mb, original);
+
+    mb.removeSection (0, 4);
+    mb.insert (original.getData(), 8, 0);
+    EXPECT_EQ (mb.getSize(), (size_t) 104);
+    EXPECT_EQ (memcmp (mb.begin(), original.begin(), 8), 0);
+    EXPECT_EQ (memcmp (mb.begin() + 8, original.begin() + 4, 96), 0);
+}
+
+TEST (MemoryBlockTests, TrimmedBlockCopiesMovesAndSwaps)
+{
+    auto mb = makeSequence (64);
+    mb.removeSection (0, 16);
+
+    const auto expected = MemoryBlock (makeSequence (64).begin() + 16, 48);
+    EXPECT_EQ (mb, expected);
+
+    MemoryBlock copy (mb);
+    EXPECT_EQ (copy, expected);
+
+    MemoryBlock assigned;
+    assigned = mb;
+    EXPECT_EQ (assigned, expected);
+
+    MemoryBlock other (makeSequence (4));
+    other.swapWith (mb);
+    EXPECT_EQ (other, expected);
+    EXPECT_EQ (mb, makeSequence (4));
+
+    MemoryBlock moved (std::move (other));
+    EXPECT_EQ (moved, expected);
+    EXPECT_EQ (moved[0], (char) 16);
+    EXPECT_EQ (moved.toBase64Encoding(), expected.toBase64Encoding());
+
+    moved.setSize (100, true);
+    EXPECT_EQ (memcmp (moved.begin(), expected.begin(), 48), 0);
+    EXPECT_EQ (moved[99], (char) 0);
+}
+
+TEST (MemoryBlockTests, RepeatedAppends)
+{
+    const auto original = makeSequence (5000);
+    MemoryBlock mb;
+
+    for (size_t i = 0; i < original.getSize(); i += 7)
+        mb.append (original.begin() + i, jmin ((size_t) 7, original.getSize() - i));
+
+    EXPECT_EQ (mb, original);
+
+    mb.setSize (10);
+    EXPECT_EQ (mb, makeSequence (10));
+
+    mb.append (original.begin() + 10, 20);
+    mb.setSize (40, true);
+    EXPECT_EQ (memcmp (mb.begin(), original.begin(), 30), 0);
+
+    for (int i = 30; i < 40; ++i)
+        EXPECT_EQ (mb[i], 0);
+}
+
+TEST (MemoryBlockTests, RepeatedInserts)
+{
+    MemoryBlock mb;
+    std::vector<char> expected;
+
+    for (int i = 0; i < 500; ++i)
+    {
+        const auto c = (char) i;
+        const auto position = (size_t) (i * 7) % (expected.size() + 1);
+        mb.insert (&c, 1, position);
+        expected.insert (expected.begin() + (std::ptrdiff_t) position, c);
+    }
+
+    EXPECT_TRUE (mb.matches (expected.data(), expected.size()));
+}
+
+TEST (MemoryBlockTests, MovedFromBlockIsEmpty)
+{
+    auto mb = makeSequence (16);
+    mb.append ("abc", 3);
+
+    MemoryBlock moved (std::move (mb));
+    EXPECT_EQ (moved.getSize(), (size_t) 19);
+    EXPECT_TRUE (mb.isEmpty());
+
+    mb.append ("xyz", 3);
+    EXPECT_TRUE (mb.matches ("xyz", 3));
+
+    mb = std::move (moved);
+    EXPECT_EQ (mb.getSize(), (size_t) 19);
+    EXPECT_EQ (memcmp (mb.begin() + 16, "abc", 3), 0);
+}
+
+TEST (MemoryBlockTests, LoadFromHexStringReplacesExistingContent)
+{
+    auto mb = makeSequence (1000);
+    mb.loadFromHexString ("0102ff");
+
+    const char expected[] = { 1, 2, (char) 0xff };
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+
+    mb.loadFromHexString (String::toHexString (makeSequence (300).getData(), 300));
+    EXPECT_EQ (mb, makeSequence (300));
+
+    mb.loadFromHexString (" - ");
+    EXPECT_TRUE (mb.isEmpty());
+}
+
+TEST (MemoryBlockTests, FillWith)
+{
+    MemoryBlock mb (100);
+    mb.fillWith (42);
+
+    for (auto c : mb)
+        EXPECT_EQ (c, (char) 42);
+
+    EXPECT_TRUE (mb.containsOnly (42));
+}
+
+TEST (MemoryBlockTests, ContainsOnly)
+{
+    EXPECT_TRUE (MemoryBlock().containsOnly (7));
+
+    MemoryBlock mb (1000);
+    mb.fillWith (7);
+    EXPECT_TRUE (mb.containsOnly (7));
+    EXPECT_FALSE (mb.containsOnly (8));
+
+    for (size_t i : { (size_t) 0, (size_t) 1, (size_t) 500, (size_t) 999 })
+    {
+        mb[i] = 8;
+        EXPECT_FALSE (mb.containsOnly (7));
+        mb[i] = 7;
+    }
+
+    EXPECT_TRUE (mb.containsOnly (7));
+}
+
+TEST (MemoryBlockTests, FillWithLargeUnalignedBlock)
+{
+    const size_t numBytes = 9 * 1024 * 1024 + 37;
+    MemoryBlock mb (numBytes + 3, true);
+
+    // Removing from the front leaves the data starting at an odd address
+    mb.removeSection (0, 3);
+    mb.fillWith (0xa5);
+
+    const auto expected = (char) 0xa5;
+    size_t numMismatches = 0;
+
+    for (auto c : mb)
+        numMismatches += (c != expected ? 1u : 0u);
+
+    EXPECT_EQ (mb.getSize(), numBytes);
+    EXPECT_EQ (numMismatches, (size_t) 0);
+    EXPECT_TRUE (mb.containsOnly (0xa5));
+}
+
+TEST (MemoryBlockTests, GetBitRange)
+{
+    const char bytes[] = { (char) 0xb5, (char) 0x3c, (char) 0xff, (char) 0x01, (char) 0x80 };
+    MemoryBlock mb (bytes, sizeof (bytes));
+
+    EXPECT_EQ (mb.getBitRange (0, 8), 0xb5);
+    EXPECT_EQ (mb.getBitRange (1, 6), 0x1a);
+    EXPECT_EQ (mb.getBitRange (4, 8), 0xcb);
+    EXPECT_EQ (mb.getBitRange (0, 32), 0x01ff3cb5);
+    EXPECT_EQ (mb.getBitRange (7, 32), 0x0003fe79);
+    EXPECT_EQ (mb.getBitRange (0, 0), 0);
+
+    // Bits beyond the end of the block read as zero
+    EXPECT_EQ (mb.getBitRange (36, 8), 0x08);
+    EXPECT_EQ (mb.getBitRange (100, 8), 0);
+}
+
+TEST (MemoryBlockTests, SetBitRange)
+{
+    MemoryBlock mb (4, true);
+
+    mb.setBitRange (2, 3, 0x7);
+    EXPECT_EQ ((uint8) mb[0], 0x1c);
+
+    // Bits of the value outside the range mustn't leak into neighbouring bits
+    mb.setBitRange (8, 4, 0xff);
+    EXPECT_EQ ((uint8) mb[1], 0x0f);
+    EXPECT_EQ ((uint8) mb[0], 0x1c);
+
+    mb.setBitRange (6, 6, 0);
+    EXPECT_EQ ((uint8) mb[0], 0x1c & 0x3f);
+    EXPECT_EQ ((uint8) mb[1], 0x00);
+
+    mb.setBitRange (0, 32, (int) 0xdeadbeef);
+    EXPECT_EQ ((uint32) mb.getBitRange (0, 32), 0xdeadbeefu);
+
+    // Writes past the end of the block are clipped
+    mb.setBitRange (28, 8, 0);
+    EXPECT_EQ ((uint8) mb[3], 0x0e);
+    mb.setBitRange (100, 8, 0xff);
+    EXPECT_EQ ((uint32) mb.getBitRange (0, 32), 0x0eadbeefu);
+}
+
+TEST (MemoryBlockTests, BitRangesMatchBitByBitReference)
+{
+    Random r (99);
+    MemoryBlock mb (16, true);
+    std::vector<bool> reference (16 * 8, false);
+
+    for (int iteration = 0; iteration < 2000; ++iteration)
+    {
+        const auto start = (size_t) r.nextInt (16 * 8);
+        const auto numBits = (size_t) r.nextInt (33);
+        const auto value = r.nextInt();
+
+        mb.setBitRange (start, numBits, value);
+
+        for (size_t i = 0; i < numBits && start + i < reference.size(); ++i)
+            reference[start + i] = (((uint32) value >> i) & 1) != 0;
+
+        const auto readStart = (size_t) r.nextInt (16 * 8);
+        const auto readBits = (size_t) r.nextInt (33);
+
+        uint32 expected = 0;
+
+        for (size_t i = 0; i < readBits && readStart + i < reference.size(); ++i)
+            if (reference[readStart + i])
+                expected |= (uint32) 1 << i;
+
+        ASSERT_EQ ((uint32) mb.getBitRange (readStart, readBits), expected);
+    }
+}
+
+TEST (MemoryBlockTests, SwapWithExchangesStorage)
+{
+    auto a = makeSequence (100);
+    a.removeSection (0, 10);
+    a.append ("xyz", 3);
+
+    MemoryBlock b ("abc", 3);
+
+    const auto* aData = a.getData();
+    const auto* bData = b.getData();
+    const auto aContents = a;
+
+    a.swapWith (b);
+
+    EXPECT_EQ (a.getData(), bData);
+    EXPECT_EQ (b.getData(), aData);
+    EXPECT_TRUE (a.matches ("abc", 3));
+    EXPECT_EQ (b, aContents);
+
+    // Both blocks keep working normally afterwards
+    b.append ("!", 1);
+    a.removeSection (0, 1);
+    EXPECT_TRUE (a.matches ("bc", 2));
+    EXPECT_EQ (b.getSize(), aContents.getSize() + 1);
+}
+
+TEST (MemoryBlockTests, CopyFrom)
+{
+    auto mb = makeSequence (10);
+    const char source[] = { 'a', 'b', 'c', 'x', 'x', 'x' };
+
+    mb.copyFrom (source, 2, 3);
+    const char expected[] = { 0, 1, 'a', 'b', 'c', 5, 6, 7, 8, 9 };
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+
+    // Clipped at the end of the block
+    mb.copyFrom (source, 8, 3);
+    EXPECT_EQ (mb[8], 'a');
+    EXPECT_EQ (mb[9], 'b');
+
+    // Nothing is written for an offset past the end
+    const auto before = mb;
+    mb.copyFrom (source, 10, 3);
+    mb.copyFrom (source, 1000, 3);
+    EXPECT_EQ (mb, before);
+}
+
+TEST (MemoryBlockTests, CopyFromNegativeOffset)
+{
+    auto mb = makeSequence (10);
+    const char source[] = { 'a', 'b', 'c', 'd', 'e', 'x', 'x', 'x' };
+
+    // Only the part of the source that lands inside the block is read
+    mb.copyFrom (source, -2, 5);
+    const char expected[] = { 'c', 'd', 'e', 3, 4, 5, 6, 7, 8, 9 };
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+
+    mb.copyFrom (source, -5, 5);
+    EXPECT_TRUE (mb.matches (expected, sizeof (expected)));
+}
+
+TEST (MemoryBlockTests, CopyTo)
+{
+    const auto mb = makeSequence (10);
+    char dest[6];
+
+    mb.copyTo (dest, 2, 3);
+    EXPECT_EQ (dest[0], 2);
+    EXPECT_EQ (dest[2], 4);
+
+    // Parts outside the block are filled with zeros
+    memset (dest, 'x', sizeof (dest));
+    mb.copyTo (dest, 7, 6);
+    const char expectedAtEnd[] = { 7, 8, 9, 0, 0, 0 };
+    EXPECT_EQ (memcmp (dest, expectedAtEnd, sizeof (dest)), 0);
+
+    memset (dest, 'x', sizeof (dest));
+    mb.copyTo (dest, -2, 4);
+    const char expectedAtStart[] = { 0, 0, 0, 1, 'x', 'x' };
+    EXPECT_EQ (memcmp (dest, expectedAtStart, sizeof (dest)), 0);
+
+    memset (dest, 'x', sizeof (dest));
+    mb.copyTo (dest, -10, 3);
+    const char expectedAllZero[] = { 0, 0, 0, 'x', 'x', 'x' };
+    EXPECT_EQ (memcmp (dest, expectedAllZero, sizeof (dest)), 0);
+
+    memset (dest, 'x', sizeof (dest));
+    mb.copyTo (dest, 50, 2);
+    const char expectedPastEnd[] = { 0, 0, 'x', 'x', 'x', 'x' };
+    EXPECT_EQ (memcmp (dest, expectedPastEnd, sizeof (dest)), 0);
+}
+
+TEST (MemoryBlockTests, ToString)
+{
+    EXPECT_EQ (MemoryBlock().toString(), String());
+
+    MemoryBlock ascii ("Hello World", 11);
+    EXPECT_EQ (ascii.toString(), "Hello World");
+
+    const char utf8[] = "caf\xc3\xa9 \xe2\x82\xac";
+    MemoryBlock multiByte (utf8, sizeof (utf8) - 1);
+    EXPECT_EQ (multiByte.toString(), String (CharPointer_UTF8 (utf8)));
+
+    // A zero-padded buffer only yields the text before the terminator
+    MemoryBlock padded (1024, true);
+    padded.copyFrom ("abc", 0, 3);
+    const auto result = padded.toString();
+    EXPECT_EQ (result, "abc");
+    EXPECT_EQ (result.getNumBytesAsUTF8(), (size_t) 3);
+}
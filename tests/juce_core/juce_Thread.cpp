@@ -0,0 +1,80 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+#if ! JUCE_WINDOWS
+#include <csignal>
+#include <pthread.h>
+#endif
+
+#include <thread>
+
+using namespace juce;
+
+TEST (ThreadTests, SleepWaitsAtLeastRequestedTime)
+{
+    for (int millisecs : { 0, 1, 15, 40 })
+    {
+        const auto start = Time::getMillisecondCounterHiRes();
+        Thread::sleep (millisecs);
+        EXPECT_GE (Time::getMillisecondCounterHiRes() - start, (double) millisecs);
+    }
+}
+
+#if ! JUCE_WINDOWS
+namespace
+{
+void ignoreSignal (int) {}
+} // namespace
+
+TEST (ThreadTests, SleepIsNotCutShortBySignals)
+{
+    struct sigaction action {};
+    struct sigaction previousAction {};
+    action.sa_handler = ignoreSignal;
+    sigemptyset (&action.sa_mask);
+    action.sa_flags = 0; // No SA_RESTART, so the signal interrupts the sleep
+    sigaction (SIGUSR1, &action, &previousAction);
+
+    const auto sleepingThread = pthread_self();
+
+    std::thread interrupter ([sleepingThread]
+    {
+        for (int i = 0; i < 5; ++i)
+        {
+            std::this_thread::sleep_for (std::chrono::milliseconds (5));
+            pthread_kill (sleepingThread, SIGUSR1);
+        }
+    });
+
+    const auto start = Time::getMillisecondCounterHiRes();
+    Thread::sleep (60);
+    const auto elapsed = Time::getMillisecondCounterHiRes() - start;
+
+    interrupter.join();
+    sigaction (SIGUSR1, &previousAction, nullptr);
+
+    EXPECT_GE (elapsed, 60.0);
+}
+#endif
@@ -178,6 +178,65 @@ TEST (TimeTests, GetUTCOffsetSeconds)
 }
 */
 
+#if ! JUCE_WINDOWS
+namespace
+{
+struct ScopedTimeZone
+{
+    explicit ScopedTimeZone(const char* zone)
+    {
+        if (auto* current = getenv("TZ"))
+            previous = current;
+
+        setenv("TZ", zone, 1);
+        tzset();
+    }
+
+    ~ScopedTimeZone()
+    {
+        if (previous.isNotEmpty())
+            setenv("TZ", previous.toRawUTF8(), 1);
+        else
+            unsetenv("TZ");
+
+        tzset();
+    }
+
+    String previous;
+};
+} // namespace
+
+TEST (TimeTests, GetUTCOffsetSecondsFollowsDaylightSaving)
+{
+    ScopedTimeZone zone("EST5EDT,M3.2.0,M11.1.0");
+
+    EXPECT_EQ(Time::fromISO8601("2021-01-15T12:00:00Z").getUTCOffsetSeconds(), -5 * 3600);
+    EXPECT_EQ(Time::fromISO8601("2021-07-15T12:00:00Z").getUTCOffsetSeconds(), -4 * 3600);
+
+    // Either side of the spring-forward instant, 2021-03-14 07:00 UTC
+    EXPECT_EQ(Time::fromISO8601("2021-03-14T06:59:59Z").getUTCOffsetSeconds(), -5 * 3600);
+    EXPECT_EQ(Time::fromISO8601("2021-03-14T07:00:00Z").getUTCOffsetSeconds(), -4 * 3600);
+
+    EXPECT_EQ(Time::fromISO8601("2021-07-15T12:00:00Z").getUTCOffsetString(true), "-04:00");
+    EXPECT_EQ(Time::fromISO8601("2021-01-15T12:00:00Z").getUTCOffsetString(false), "-0500");
+}
+
+TEST (TimeTests, GetUTCOffsetSecondsMatchesLocalFields)
+{
+    ScopedTimeZone zone("Australia/Adelaide");
+
+    for (int64 millis = 1600000000000; millis < 1700000000000; millis += 86400000LL * 17 + 3723000)
+    {
+        Time time(millis);
+        Time localFieldsAsUTC(time.getYear(), time.getMonth(), time.getDayOfMonth(),
+                              time.getHours(), time.getMinutes(), time.getSeconds(), 0, false);
+
+        EXPECT_EQ((int64) time.getUTCOffsetSeconds() * 1000,
+                  localFieldsAsUTC.toMilliseconds() - (millis - millis % 1000));
+    }
+}
+#endif
+
 TEST (TimeTests, GetUTCOffsetString)
 {
     Time time(1625000000000);
@@ -254,6 +313,18 @@ TEST (TimeTests, GetMillisecondCounter)
     EXPECT_GT(millis2, millis1);
 }
 
+TEST (TimeTests, WaitForMillisecondCounter)
+{
+    uint32 start = Time::getMillisecondCounter();
+    Time::waitForMillisecondCounter(start + 50);
+    uint32 end = Time::getMillisecondCounter();
+    EXPECT_GE(end, start + 50);
+
+    // A target that has already passed returns straight away
+    Time::waitForMillisecondCounter(end - 10);
+    EXPECT_LT(Time::getMillisecondCounter() - end, 10u);
+}
+
 TEST (TimeTests, GetMillisecondCounterHiRes)
 {
     double hiResMillis1 = Time::getMillisecondCounterHiRes();
@@ -307,3 +378,24 @@ TEST (TimeTests, SetSystemTimeToThisTime)
     // This test may fail if the system does not have sufficient privileges
     // EXPECT_TRUE(now.setSystemTimeToThisTime());
 }
+
+TEST (TimeTests, RelativeTimeMillisecondsRoundTrip)
+{
+    for (int64 ms = -100000; ms <= 100000; ++ms)
+        ASSERT_EQ(RelativeTime::milliseconds(ms).inMilliseconds(), ms);
+
+    Time start(1625000000000);
+
+    for (int64 ms = 0; ms < 100000; ms += 7)
+    {
+        Time end(1625000000000 + ms * 1001);
+        EXPECT_EQ(start + (end - start), end);
+    }
+}
+
+TEST (TimeTests, AddRelativeDays)
+{
+    EXPECT_EQ(Time(1982, 0, 1, 12, 0, 0, 0, false) + RelativeTime::days(365), Time(1983, 0, 1, 12, 0, 0, 0, false));
+    EXPECT_EQ(Time(2038, 0, 1, 12, 0, 0, 0, false) + RelativeTime::days(365), Time(2039, 0, 1, 12, 0, 0, 0, false));
+    EXPECT_EQ(RelativeTime::days(365).inMilliseconds(), (int64) 365 * 24 * 60 * 60 * 1000);
+}
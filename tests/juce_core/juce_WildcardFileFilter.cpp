@@ -0,0 +1,74 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+namespace
+{
+File fileNamed (const String& name)
+{
+    return File::getSpecialLocation (File::tempDirectory).getChildFile (name);
+}
+} // namespace
+
+TEST (WildcardFileFilterTests, MatchesExtensionsCaseInsensitively)
+{
+    WildcardFileFilter filter ("*.wav;*.AIFF", {}, {});
+
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("kick.wav")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("Kick.WAV")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("snare.aiff")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed (".wav")));
+    EXPECT_FALSE (filter.isFileSuitable (fileNamed ("kick.wave")));
+    EXPECT_FALSE (filter.isFileSuitable (fileNamed ("kickwav")));
+}
+
+TEST (WildcardFileFilterTests, StarDotStarMatchesFilesWithoutExtension)
+{
+    WildcardFileFilter filter ("*.*", "*", {});
+
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("README")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("notes.txt")));
+    EXPECT_TRUE (filter.isDirectorySuitable (fileNamed ("folder")));
+}
+
+TEST (WildcardFileFilterTests, GeneralWildcardsStillMatch)
+{
+    WildcardFileFilter filter ("take?.wav, *drum*.*; loop_*", {}, {});
+
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("take1.wav")));
+    EXPECT_FALSE (filter.isFileSuitable (fileNamed ("take10.wav")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("BigDrums.flac")));
+    EXPECT_TRUE (filter.isFileSuitable (fileNamed ("LOOP_01")));
+    EXPECT_FALSE (filter.isFileSuitable (fileNamed ("bass.flac")));
+}
+
+TEST (WildcardFileFilterTests, EmptyPatternsMatchNothing)
+{
+    WildcardFileFilter filter ({}, " ; ", {});
+
+    EXPECT_FALSE (filter.isFileSuitable (fileNamed ("anything.txt")));
+    EXPECT_FALSE (filter.isDirectorySuitable (fileNamed ("folder")));
+}
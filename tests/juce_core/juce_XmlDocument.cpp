@@ -0,0 +1,177 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <juce_core/juce_core.h>
+
+using namespace juce;
+
+namespace
+{
+class XmlDocumentTests : public ::testing::Test
+{
+protected:
+    void SetUp() override
+    {
+        tempFile = File::getSpecialLocation (File::tempDirectory)
+                       .getNonexistentChildFile ("yup_xml_test", ".xml", false);
+    }
+
+    void TearDown() override
+    {
+        tempFile.deleteFile();
+    }
+
+    File tempFile;
+};
+} // namespace
+
+TEST_F (XmlDocumentTests, ParseFile)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("<?xml version=\"1.0\"?>\n<root a=\"1\"><child>text</child></root>", false, false, nullptr));
+
+    auto xml = XmlDocument::parse (tempFile);
+    ASSERT_NE (xml, nullptr);
+    EXPECT_TRUE (xml->hasTagName ("root"));
+    EXPECT_EQ (xml->getIntAttribute ("a"), 1);
+    EXPECT_EQ (xml->getChildElementAllSubText ("child", {}), "text");
+}
+
+TEST_F (XmlDocumentTests, ParseFileWithByteOrderMark)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("<root>" + String::charToString (0x20ac) + "</root>", false, true, nullptr));
+
+    auto xml = XmlDocument::parse (tempFile);
+    ASSERT_NE (xml, nullptr);
+    EXPECT_EQ (xml->getAllSubText(), String::charToString (0x20ac));
+}
+
+TEST_F (XmlDocumentTests, ParseUTF16File)
+{
+    ASSERT_TRUE (tempFile.replaceWithText ("<root><child/></root>", true, true, nullptr));
+
+    auto xml = XmlDocument::parse (tempFile);
+    ASSERT_NE (xml, nullptr);
+    EXPECT_TRUE (xml->hasTagName ("root"));
+    EXPECT_NE (xml->getChildByName ("child"), nullptr);
+}
+
+TEST_F (XmlDocumentTests, ParseLargeFile)
+{
+    XmlElement root ("root");
+
+    for (int i = 0; i < 5000; ++i)
+        root.createNewChildElement ("item")->setAttribute ("index", i);
+
+    ASSERT_TRUE (root.writeTo (tempFile));
+
+    auto xml = parseXML (tempFile);
+    ASSERT_NE (xml, nullptr);
+    EXPECT_EQ (xml->getNumChildElements(), 5000);
+    EXPECT_EQ (xml->getChildElement (4999)->getIntAttribute ("index"), 4999);
+
+    auto outer = XmlDocument (tempFile).getDocumentElement (true);
+    ASSERT_NE (outer, nullptr);
+    EXPECT_TRUE (outer->hasTagName ("root"));
+    EXPECT_EQ (outer->getNumChildElements(), 0);
+}
+
+TEST_F (XmlDocumentTests, ParseEmptyOrMissingFile)
+{
+    XmlDocument missing (tempFile);
+    EXPECT_EQ (missing.getDocumentElement(), nullptr);
+    EXPECT_FALSE (missing.getLastParseError().isEmpty());
+
+    ASSERT_TRUE (tempFile.create());
+    EXPECT_EQ (XmlDocument::parse (tempFile), nullptr);
+}
+
+TEST (XmlDocumentTextTests, TextContentIsCopiedWithLineEndingsNormalised)
+{
+    auto xml = parseXML ("<root>a\r\nb\rc\nd &amp; " + String::charToString (0x20ac) + " e</root>");
+    ASSERT_NE (xml, nullptr);
+    EXPECT_EQ (xml->getAllSubText(), "a\nb\nc\nd & " + String::charToString (0x20ac) + " e");
+}
+
+TEST (XmlDocumentTextTests, WhitespaceOnlyTextIsIgnoredByDefault)
+{
+    auto xml = parseXML ("<root>\r\n  <a/>\r\n  <b>x<!-- comment -->y</b>\n</root>");
+    ASSERT_NE (xml, nullptr);
+    EXPECT_EQ (xml->getNumChildElements(), 2);
+    EXPECT_EQ (xml->getChildByName ("b")->getAllSubText(), "xy");
+}
+
+TEST (XmlDocumentTextTests, UnterminatedTextIsAnError)
+{
+    XmlDocument doc ("<root>some text");
+    EXPECT_EQ (doc.getDocumentElement(), nullptr);
+    EXPECT_FALSE (doc.getLastParseError().isEmpty());
+}
+
+namespace
+{
+class ShortReadInputStream : public MemoryInputStream
+{
+public:
+    ShortReadInputStream (const String& text)
+        : MemoryInputStream (text.toRawUTF8(), text.getNumBytesAsUTF8(), true)
+    {
+    }
+
+    int read (void* destBuffer, int maxBytesToRead) override
+    {
+        return MemoryInputStream::read (destBuffer, jmin (maxBytesToRead, 7));
+    }
+};
+
+class ShortReadInputSource : public InputSource
+{
+public:
+    ShortReadInputSource (const String& textToUse)
+        : text (textToUse)
+    {
+    }
+
+    InputStream* createInputStream() override { return new ShortReadInputStream (text); }
+    InputStream* createInputStreamFor (const String&) override { return nullptr; }
+    int64 hashCode() const override { return text.hashCode64(); }
+
+private:
+    String text;
+};
+} // namespace
+
+TEST (XmlDocumentStreamTests, ParseStreamThatReturnsShortReads)
+{
+    XmlElement root ("root");
+
+    for (int i = 0; i < 100; ++i)
+        root.createNewChildElement ("item")->setAttribute ("index", i);
+
+    XmlDocument doc (String {});
+    doc.setInputSource (new ShortReadInputSource (root.toString()));
+
+    auto xml = doc.getDocumentElement();
+    ASSERT_NE (xml, nullptr);
+    EXPECT_EQ (xml->getNumChildElements(), 100);
+    EXPECT_EQ (xml->getChildElement (99)->getIntAttribute ("index"), 99);
+}
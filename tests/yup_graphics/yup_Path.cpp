@@ -0,0 +1,119 @@
+/*
+  ==============================================================================
+
+   This file is part of the YUP library.
+   Copyright (c) 2024 - kunitoki@gmail.com
+
+   YUP is an open source library subject to open-source licensing.
+
+   The code included in this file is provided under the terms of the ISC license
+   http://www.isc.org/downloads/software-support-policy/isc-license. Permission
+   to use, copy, modify, and/or distribute this software for any purpose with or
+   without fee is hereby granted provided that the above copyright notice and
+   this permission notice appear in all copies.
+
+   YUP IS PROVIDED "AS IS" WITHOUT ANY WARRANTY, AND ALL WARRANTIES, WHETHER
+   EXPRESSED OR IMPLIED, INCLUDING MERCHANTABILITY AND FITNESS FOR PURPOSE, ARE
+   DISCLAIMED.
+
+  ==============================================================================
+*/
+
+#include <gtest/gtest.h>
+
+#include <yup_graphics/yup_graphics.h>
+
+using namespace yup;
+
+namespace
+{
+void expectBounds (const Rectangle<float>& bounds, float x, float y, float width, float height)
+{
+    constexpr float tolerance = 1.0e-4f;
+
+    EXPECT_NEAR (bounds.getX(), x, tolerance);
+    EXPECT_NEAR (bounds.getY(), y, tolerance);
+    EXPECT_NEAR (bounds.getWidth(), width, tolerance);
+    EXPECT_NEAR (bounds.getHeight(), height, tolerance);
+}
+} // namespace
+
+TEST (PathTests, EmptyPathHasEmptyBoundingBox)
+{
+    Path path;
+    expectBounds (path.getBoundingBox(), 0.0f, 0.0f, 0.0f, 0.0f);
+
+    path.addRectangle (1.0f, 2.0f, 3.0f, 4.0f);
+    path.clear();
+    expectBounds (path.getBoundingBox(), 0.0f, 0.0f, 0.0f, 0.0f);
+}
+
+TEST (PathTests, BoundingBoxInNegativeCoordinates)
+{
+    Path path;
+    path.moveTo (-10.0f, -20.0f);
+    path.lineTo (-5.0f, -8.0f);
+
+    expectBounds (path.getBoundingBox(), -10.0f, -20.0f, 5.0f, 12.0f);
+}
+
+TEST (PathTests, BoundingBoxIncludesControlPoints)
+{
+    Path quad;
+    quad.moveTo (0.0f, 0.0f);
+    quad.quadTo (4.0f, -6.0f, 10.0f, 2.0f);
+    expectBounds (quad.getBoundingBox(), 0.0f, -6.0f, 10.0f, 8.0f);
+
+    Path cubic;
+    cubic.moveTo (0.0f, 0.0f);
+    cubic.cubicTo (-5.0f, 2.0f, 3.0f, 12.0f, 8.0f, 4.0f);
+    expectBounds (cubic.getBoundingBox(), -5.0f, 0.0f, 13.0f, 12.0f);
+}
+
+TEST (PathTests, ReplacedMoveToIsNotPartOfBoundingBox)
+{
+    Path path;
+    path.moveTo (100.0f, 100.0f);
+    path.moveTo (1.0f, 1.0f);
+    path.lineTo (2.0f, 3.0f);
+
+    expectBounds (path.getBoundingBox(), 1.0f, 1.0f, 1.0f, 2.0f);
+}
+
+TEST (PathTests, BoundingBoxFollowsScaleAndTranslation)
+{
+    Path path;
+    path.addRectangle (0.0f, 0.0f, 10.0f, 20.0f);
+    path.transform (AffineTransform::scaling (2.0f).translated (5.0f, 5.0f));
+
+    expectBounds (path.getBoundingBox(), 5.0f, 5.0f, 20.0f, 40.0f);
+}
+
+TEST (PathTests, BoundingBoxIsRecomputedAfterRotation)
+{
+    Path path;
+    path.addRectangle (0.0f, 0.0f, 10.0f, 10.0f);
+    expectBounds (path.getBoundingBox(), 0.0f, 0.0f, 10.0f, 10.0f);
+
+    path.transform (AffineTransform::rotation (MathConstants<float>::pi / 4.0f));
+
+    const auto halfDiagonal = 10.0f * std::sqrt (2.0f) / 2.0f;
+    expectBounds (path.getBoundingBox(), -halfDiagonal, 0.0f, 2.0f * halfDiagonal, 2.0f * halfDiagonal);
+}
+
+TEST (PathTests, AppendedPathExtendsBoundingBox)
+{
+    Path first;
+    first.moveTo (1.0f, 1.0f);
+    first.lineTo (2.0f, 3.0f);
+
+    Path second;
+    second.moveTo (-10.0f, -20.0f);
+    second.lineTo (-5.0f, -8.0f);
+
+    Path path;
+    path.appendPath (first);
+    path.appendPath (second);
+
+    expectBounds (path.getBoundingBox(), -10.0f, -20.0f, 12.0f, 23.0f);
+}